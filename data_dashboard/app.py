@@ -1,59 +1,350 @@
 from __future__ import annotations
 
+import csv
+import functools
+import math
+import os
 from pathlib import Path
 from typing import Iterable
 
+import flask
 import pandas as pd
 import plotly.express as px
-from dash import Dash, Input, Output, State, dcc, html, dash_table
-from dash.exceptions import PreventUpdate
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from dash import Dash, Input, Output, State, callback_context, dcc, html, dash_table
+from dash.exceptions import MissingCallbackContextException, PreventUpdate
 
 from data_pipeline.settings import AGGREGATIONS_DIR, REJECTED_OUTPUT_DIR, ensure_directories
 
 _ANOMALY_FILENAME = "anomaly_records.parquet"
+_TOP_CATEGORIES_FILENAME = "top_categories.parquet"
 _TOP_PRODUCTS_BY_CATEGORY_FILENAME = "top_products_by_category.parquet"
 _PREVIEW_ROW_LIMIT = 50
+_TABLE_PAGE_SIZE = 25
 _TOP_REASON_LIMIT = 5
+_CATEGORY_TABLE_COLUMNS = (
+    "category",
+    "rank",
+    "product_name",
+    "total_revenue",
+    "total_quantity",
+    "order_count",
+    "metric_type",
+)
+# Low-cardinality label columns stored as ``category`` so filters compare codes.
+_CATEGORICAL_COLUMNS = ("category", "metric_type")
 
+_REJECTION_REASON_COLUMN = "rejection_reason"
 
-def _list_parquet_files(directory: Path) -> list[Path]:
-    if not directory.exists():
+# mtime-keyed loader caches, cleared once per click of the "Refresh data" button
+# so a file rewritten within the filesystem's mtime resolution is still reloaded.
+_FILE_CACHES: list = []
+# The refresh click count the caches were last cleared for.
+_cleared_refresh_clicks: list[int | None] = [None]
+
+
+def _file_cache(maxsize: int):
+    """LRU-cache a loader called as ``loader(path_str, mtime_ns, size, *args)``."""
+    def decorator(func):
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        _FILE_CACHES.append(cached)
+        return cached
+    return decorator
+
+
+@_file_cache(maxsize=8)
+def _list_files_cached(dir_str: str, mtime_ns: int, size: int, suffix: str) -> tuple[str, ...]:
+    with os.scandir(dir_str) as entries:
+        return tuple(
+            sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            )
+        )
+
+
+def _list_files(directory: Path, suffix: str) -> list[Path]:
+    """List files in ``directory`` ending with ``suffix``, ordered by name.
+
+    The listing is cached on the directory's mtime, which changes whenever
+    an entry is added, removed or renamed.
+    """
+    try:
+        names = _cached_load(_list_files_cached, directory, suffix)
+    except FileNotFoundError:
         return []
-    return sorted(directory.glob("*.parquet"))
+    return [directory / name for name in names]
+
+
+@_file_cache(maxsize=8)
+def _file_index_cached(dir_str: str, mtime_ns: int, size: int, suffix: str) -> dict[str, Path]:
+    directory = Path(dir_str)
+    return {name: directory / name for name in _list_files_cached(dir_str, mtime_ns, size, suffix)}
+
+
+def _parquet_index(directory: Path) -> dict[str, Path]:
+    """Map file names to paths for the parquet files in ``directory``.
+
+    The mapping is cached like ``_list_files`` and must not be mutated.
+    """
+    try:
+        return _cached_load(_file_index_cached, directory, ".parquet")
+    except FileNotFoundError:
+        return {}
+
+
+def _list_parquet_files(directory: Path) -> list[Path]:
+    return _list_files(directory, ".parquet")
 
 
 def _list_csv_files(directory: Path) -> list[Path]:
-    if not directory.exists():
-        return []
-    return sorted(directory.glob("*.csv"))
+    return _list_files(directory, ".csv")
+
+
+def _categorise_labels(df: pd.DataFrame) -> pd.DataFrame:
+    for column in _CATEGORICAL_COLUMNS:
+        if column in df.columns and df[column].dtype == object:
+            df[column] = df[column].astype("category")
+    return df
+
+
+@_file_cache(maxsize=32)
+def _load_parquet_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    columns: tuple[str, ...] | None,
+) -> pd.DataFrame:
+    if columns is not None:
+        # Only project columns the file actually has so callers can keep their
+        # own "column missing" checks instead of handling read errors.
+        available = set(pq.read_schema(path_str).names)
+        columns = [column for column in columns if column in available]
+    table = pq.read_table(path_str, columns=columns, memory_map=True)
+    return _categorise_labels(table.to_pandas(split_blocks=True, self_destruct=True))
+
+
+@_file_cache(maxsize=32)
+def _load_parquet_table_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    columns: tuple[str, ...] | None,
+) -> pa.Table:
+    if columns is not None:
+        available = set(pq.read_schema(path_str).names)
+        columns = [column for column in columns if column in available]
+    return pq.read_table(path_str, columns=columns, memory_map=True)
+
+
+@_file_cache(maxsize=16)
+def _load_parquet_filtered_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    column: str,
+    values: tuple[str, ...],
+) -> pa.Table:
+    if column not in pq.read_schema(path_str).names:
+        return pq.read_table(path_str, memory_map=True)
+    field = pc.field(column)
+    predicate = field.isin(list(values))
+    if "UNKNOWN" in values:
+        # Missing reasons are reported as UNKNOWN by _reason_counts.
+        predicate = predicate | field.is_null()
+    # Row groups whose statistics exclude every value are skipped undecoded.
+    return pq.read_table(path_str, filters=predicate, memory_map=True)
 
 
-def _load_parquet(path: Path) -> pd.DataFrame:
-    return pd.read_parquet(path)
+@_file_cache(maxsize=32)
+def _load_csv_cached(path_str: str, mtime_ns: int, size: int) -> pa.Table:
+    # Rejected rows hold the raw, dirty values, so read every column as text
+    # rather than letting type inference fail on a later block. The reason
+    # column repeats a handful of values and is dictionary-encoded so counts
+    # and filters work on its small dictionary.
+    with open(path_str, newline="", encoding="utf-8") as fh:
+        header = next(csv.reader(fh), [])
+    column_types = {name: pa.string() for name in header}
+    if _REJECTION_REASON_COLUMN in column_types:
+        column_types[_REJECTION_REASON_COLUMN] = pa.dictionary(pa.int32(), pa.string())
+    convert_options = pa_csv.ConvertOptions(
+        column_types=column_types,
+        strings_can_be_null=True,
+    )
+    return pa_csv.read_csv(path_str, convert_options=convert_options)
 
 
-def _load_csv(path: Path) -> pd.DataFrame:
-    return pd.read_csv(path)
+@_file_cache(maxsize=32)
+def _parquet_unique_values_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    column: str,
+) -> tuple[str, ...]:
+    if column not in pq.read_schema(path_str).names:
+        return ()
+    # Reading as dictionary keeps string columns in their encoded form, so the
+    # distinct values come straight from the dictionary pages.
+    table = pq.ParquetFile(path_str, read_dictionary=[column]).read(columns=[column])
+    values: set = set()
+    for chunk in table.column(column).chunks:
+        if pa.types.is_dictionary(chunk.type):
+            values.update(chunk.dictionary.to_pylist())
+        else:
+            values.update(chunk.unique().to_pylist())
+    return tuple(sorted(str(value) for value in values if value is not None))
 
 
-def _dataframe_preview(df: pd.DataFrame) -> tuple[list[dict], list[dict]]:
-    preview = df.head(_PREVIEW_ROW_LIMIT)
-    data = preview.to_dict("records")
-    columns = [{"name": str(col), "id": str(col)} for col in preview.columns]
+@_file_cache(maxsize=32)
+def _parquet_overview_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+) -> tuple[pa.Schema, int, pa.Table]:
+    parquet_file = pq.ParquetFile(path_str)
+    schema = parquet_file.schema_arrow
+    # Stream just enough batches for the preview rather than decoding the
+    # whole first row group.
+    batches = []
+    remaining = _PREVIEW_ROW_LIMIT
+    for batch in parquet_file.iter_batches(batch_size=_PREVIEW_ROW_LIMIT):
+        batches.append(batch.slice(0, remaining))
+        remaining -= min(remaining, batch.num_rows)
+        if not remaining:
+            break
+    head = pa.Table.from_batches(batches) if batches else schema.empty_table()
+    return schema, parquet_file.metadata.num_rows, head
+
+
+def _request_cache() -> dict | None:
+    """Return a dict scoped to the current Flask request, if there is one."""
+    if not flask.has_request_context():
+        return None
+    cache = getattr(flask.g, "_dashboard_loads", None)
+    if cache is None:
+        cache = flask.g._dashboard_loads = {}
+    return cache
+
+
+def _refresh_clicks() -> int | None:
+    """Return the refresh button's click count if it triggered the current callback."""
+    try:
+        if callback_context.triggered_id != "refresh-data":
+            return None
+        return callback_context.inputs.get("refresh-data.n_clicks")
+    except MissingCallbackContextException:
+        return None
+
+
+def _cached_load(loader, path: Path, *args):
+    """Call an mtime-keyed ``loader`` for ``path``, memoised for the current request.
+
+    Results are shared between callbacks and must not be mutated.
+    """
+    request_cache = _request_cache()
+    clicks = _refresh_clicks()
+    # Every callback wired to the button sees the same click; only the first clears.
+    if clicks is not None and clicks != _cleared_refresh_clicks[0]:
+        _cleared_refresh_clicks[0] = clicks
+        for cache in _FILE_CACHES:
+            cache.cache_clear()
+    key = (loader.__name__, str(path), args)
+    if request_cache is not None and key in request_cache:
+        return request_cache[key]
+    stat = path.stat()
+    result = loader(str(path), stat.st_mtime_ns, stat.st_size, *args)
+    if request_cache is not None:
+        request_cache[key] = result
+    return result
+
+
+def _load_parquet(path: Path, columns: Iterable[str] | None = None) -> pd.DataFrame:
+    """Load a parquet file as pandas, restricted to ``columns`` when given.
+
+    Requested names absent from the file are ignored.
+    """
+    projection = tuple(columns) if columns is not None else None
+    return _cached_load(_load_parquet_cached, path, projection)
+
+
+def _load_parquet_table(path: Path, columns: Iterable[str] | None = None) -> pa.Table:
+    """Load a parquet file as Arrow, restricted to ``columns`` when given."""
+    projection = tuple(columns) if columns is not None else None
+    return _cached_load(_load_parquet_table_cached, path, projection)
+
+
+def _load_parquet_filtered(path: Path, column: str, values: Iterable[str]) -> pa.Table:
+    """Load only the rows whose ``column`` is one of ``values``, filtering in the reader."""
+    return _cached_load(_load_parquet_filtered_cached, path, column, tuple(sorted(values)))
+
+
+def _load_csv(path: Path) -> pa.Table:
+    return _cached_load(_load_csv_cached, path)
+
+
+def _parquet_unique_values(path: Path, column: str) -> list[str]:
+    """Return the sorted distinct non-null values of ``column`` as strings."""
+    return list(_cached_load(_parquet_unique_values_cached, path, column))
+
+
+def _parquet_overview(path: Path) -> tuple[pa.Schema, int, pa.Table]:
+    """Return the schema and row count from the footer plus the preview rows.
+
+    Only the first few batches are decoded, so large files are never fully read.
+    """
+    return _cached_load(_parquet_overview_cached, path)
+
+
+def _table_page(
+    table: pa.Table,
+    page_current: int | None,
+    page_size: int | None,
+    sort_by: list[dict] | None,
+) -> tuple[list[dict], list[dict], int]:
+    """Sort server-side and return only the rows of the requested table page."""
+    if sort_by:
+        sort_keys = [
+            (item["column_id"], "ascending" if item["direction"] == "asc" else "descending")
+            for item in sort_by
+            if item["column_id"] in table.column_names
+        ]
+        if sort_keys:
+            table = table.sort_by(sort_keys)
+    size = page_size or _TABLE_PAGE_SIZE
+    page_count = max(1, math.ceil(table.num_rows / size))
+    page = min(max(page_current or 0, 0), page_count - 1)
+    data = table.slice(page * size, size).to_pylist()
+    columns = [{"name": name, "id": name} for name in table.column_names]
+    return data, columns, page_count
+
+
+def _arrow_preview(table: pa.Table) -> tuple[list[dict], list[dict]]:
+    data = table.slice(0, _PREVIEW_ROW_LIMIT).to_pylist()
+    columns = [{"name": name, "id": name} for name in table.column_names]
     return data, columns
 
 
-def _summarise_dataframe(df: pd.DataFrame, source: Path) -> html.Div:
-    column_items = [
-        html.Li(f"{name}: {dtype}")
-        for name, dtype in df.dtypes.items()
-    ] or [html.Li("No columns present")]
+def _summarise_schema(schema: pa.Schema, num_rows: int, source: Path) -> html.Div:
+    dtypes = tuple((field.name, str(field.type)) for field in schema)
+    return _summarise_columns(source.name, num_rows, dtypes)
+
+
+@functools.lru_cache(maxsize=16)
+def _summarise_columns(name: str, num_rows: int, dtypes: tuple[tuple[str, str], ...]) -> html.Div:
+    # Memoised: the component tree is identical while the file is unchanged.
+    # One text node rather than a component per column keeps wide files cheap
+    # to build and serialise.
+    column_text = "\n".join(f"{column}: {dtype}" for column, dtype in dtypes) or "No columns present"
     return html.Div(
         [
-            html.P(f"{source.name} • {len(df):,} rows × {len(df.columns)} columns"),
+            html.P(f"{name} • {num_rows:,} rows × {len(dtypes)} columns"),
             html.Details([
                 html.Summary("Column dtypes"),
-                html.Ul(column_items),
+                html.Pre(column_text, style={"margin": 0}),
             ]),
         ],
     )
@@ -67,6 +358,39 @@ def _empty_figure(title: str):
     return {"data": [], "layout": {"title": title}}
 
 
+def _bar_figure(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    *,
+    title: str,
+    labels: dict[str, str] | None = None,
+    hover_data: Iterable[str] = (),
+) -> dict:
+    """Build a single-trace bar chart as a plain plotly dict.
+
+    Skips plotly express input inference and figure validation, which dominate
+    the cost for the handful of bars these charts show.
+    """
+    labels = labels or {}
+    hover_columns = [column for column in hover_data if column in df.columns]
+    hovertemplate = f"{labels.get(x, x)}=%{{x}}<br>{labels.get(y, y)}=%{{y}}"
+    trace = {"type": "bar", "x": df[x].tolist(), "y": df[y].tolist()}
+    if hover_columns:
+        trace["customdata"] = df[hover_columns].to_numpy().tolist()
+        for index, column in enumerate(hover_columns):
+            hovertemplate += f"<br>{labels.get(column, column)}=%{{customdata[{index}]}}"
+    trace["hovertemplate"] = hovertemplate + "<extra></extra>"
+    return {
+        "data": [trace],
+        "layout": {
+            "title": {"text": title},
+            "xaxis": {"title": {"text": labels.get(x, x)}},
+            "yaxis": {"title": {"text": labels.get(y, y)}},
+        },
+    }
+
+
 def _create_top_categories_figure(df: pd.DataFrame):
     """Create a custom figure for top_categories with human-friendly titles (default: discount)"""
     return _create_dynamic_top_categories_figure(df, "avg_discount_percent")
@@ -103,15 +427,15 @@ def _create_dynamic_top_categories_figure(df: pd.DataFrame, metric: str):
     })
     
     # Sort by the selected metric and show top 15
-    top_categories = df.sort_values(metric, ascending=False).head(15)
+    top_categories = df.nlargest(15, metric)
     
-    return px.bar(
-        top_categories, 
-        x="category", 
-        y=metric,
+    return _bar_figure(
+        top_categories,
+        "category",
+        metric,
         title=f"{config['title']} (Click to view category products)",
         labels={"category": "Category", metric: config["label"]},
-        hover_data=config["hover_data"]
+        hover_data=config["hover_data"],
     )
 
 
@@ -148,75 +472,158 @@ def _create_top_products_by_category_figure(df: pd.DataFrame, metric: str):
     # Sum by category and sort descending
     if metric not in df.columns:
         return None
-    category_metrics = df.groupby("category")[metric].sum().reset_index()
-    category_metrics = category_metrics.sort_values(metric, ascending=False).head(15)
+    category_metrics = df.groupby("category", observed=True)[metric].sum().nlargest(15).reset_index()
     
-    return px.bar(
-        category_metrics, 
-        x="category", 
-        y=metric,
-        title=config['title'],
-        labels={"category": "Category", metric: config["label"]}
+    return _bar_figure(
+        category_metrics,
+        "category",
+        metric,
+        title=config["title"],
+        labels={"category": "Category", metric: config["label"]},
     )
 
 
-def _default_figure(df: pd.DataFrame, title: str):
-    if df.empty:
+def _default_figure_columns(schema: pa.Schema) -> tuple[str, ...] | None:
+    """Return the first numeric and first non-numeric column ``_default_figure`` plots."""
+    numeric = [
+        field.name
+        for field in schema
+        if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+    ]
+    if not numeric:
         return None
-    numeric_cols = df.select_dtypes(include="number").columns.tolist()
-    if not numeric_cols:
+    others = [field.name for field in schema if field.name not in numeric]
+    return (numeric[0], *others[:1])
+
+
+def _default_figure(table: pa.Table, title: str):
+    columns = _default_figure_columns(table.schema)
+    if table.num_rows == 0 or columns is None:
         return None
-    categorical_cols = df.select_dtypes(exclude="number").columns.tolist()
-    numeric = numeric_cols[0]
-    if categorical_cols:
-        category = categorical_cols[0]
-        aggregated = (
-            df.groupby(category, dropna=False)[numeric]
-            .sum()
-            .reset_index()
-            .sort_values(numeric, ascending=False)
-            .head(15)
+    numeric, *categorical = columns
+    if categorical:
+        category = categorical[0]
+        # Arrow's hash aggregation keeps null keys as their own group, like
+        # ``dropna=False``; ``min_count=0`` makes all-null groups sum to 0.
+        grouped = table.group_by(category).aggregate(
+            [(numeric, "sum", pc.ScalarAggregateOptions(min_count=0))]
         )
-        return px.bar(aggregated, x=category, y=numeric, title=f"{title}: {numeric} by {category}")
-    return px.histogram(df, x=numeric, nbins=30, title=f"{title}: Distribution of {numeric}")
+        top = grouped.sort_by([(f"{numeric}_sum", "descending")]).slice(0, 15)
+        aggregated = pd.DataFrame(
+            {category: top[category].to_pylist(), numeric: top[f"{numeric}_sum"].to_pylist()}
+        )
+        return _bar_figure(aggregated, category, numeric, title=f"{title}: {numeric} by {category}")
+    return {
+        "data": [{"type": "histogram", "x": table[numeric].to_pylist(), "nbinsx": 30}],
+        "layout": {
+            "title": {"text": f"{title}: Distribution of {numeric}"},
+            "xaxis": {"title": {"text": numeric}},
+            "yaxis": {"title": {"text": "count"}},
+        },
+    }
+
+
+@_file_cache(maxsize=64)
+def _aggregation_figure_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    metric: str | None,
+) -> dict | None:
+    path = Path(path_str)
+    if path.name not in (_TOP_CATEGORIES_FILENAME, _TOP_PRODUCTS_BY_CATEGORY_FILENAME):
+        columns = _default_figure_columns(pq.read_schema(path_str))
+        if columns is None:
+            return None
+        return _default_figure(pq.read_table(path_str, columns=list(columns), memory_map=True), path.stem)
+    df = _load_parquet_cached(path_str, mtime_ns, size, None)
+    if path.name == _TOP_CATEGORIES_FILENAME:
+        figure = (
+            _create_dynamic_top_categories_figure(df, metric)
+            if metric
+            else _create_top_categories_figure(df)
+        )
+    else:
+        figure = _create_top_products_by_category_figure(df, metric or "total_revenue")
+    return figure
+
+
+def _aggregation_figure(path: Path, metric: str | None = None) -> dict | None:
+    """Return the chart for an aggregation file, memoised per file mtime and metric."""
+    return _cached_load(_aggregation_figure_cached, path, metric)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_aggregation_options_cached(paths: tuple[str, ...]) -> tuple[dict, ...]:
+    return tuple(
+        {"label": Path(path).stem.replace("_", " ").title(), "value": path}
+        for path in paths
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_rejected_options_cached(paths: tuple[str, ...]) -> tuple[dict, ...]:
+    return tuple({"label": Path(path).name, "value": path} for path in paths)
 
 
 def _build_aggregation_options(files: Iterable[Path]) -> list[dict]:
-    options = []
-    for path in files:
-        options.append({"label": path.stem.replace("_", " ").title(), "value": str(path)})
-    return options
+    return list(_build_aggregation_options_cached(tuple(str(path) for path in files)))
 
 
 def _build_rejected_options(files: Iterable[Path]) -> list[dict]:
-    options = []
-    for path in files:
-        options.append({"label": path.name, "value": str(path)})
-    return options
-
-
-def _reason_counts(df: pd.DataFrame, column: str, *, limit: int | None = None) -> pd.Series:
-    if column not in df.columns or df.empty:
-        return pd.Series(dtype="Int64")
-    counts = (
-        df[column]
-        .fillna("UNKNOWN")
-        .astype(str)
-        .value_counts()
-    )
+    return list(_build_rejected_options_cached(tuple(str(path) for path in files)))
+
+
+def _reason_values(table: pa.Table, column: str) -> pa.ChunkedArray:
+    values = table.column(column)
+    if pa.types.is_dictionary(values.type) and pa.types.is_string(values.type.value_type):
+        return values
+    if not pa.types.is_string(values.type):
+        values = values.cast(pa.string())
+    return values
+
+
+def _reason_mask(values: pa.ChunkedArray, chosen: list[str]) -> pa.ChunkedArray:
+    # Missing reasons are reported as UNKNOWN by _reason_counts; a null in the
+    # value set makes is_in match them in the same pass.
+    match_nulls = "UNKNOWN" in chosen
+    value_set = pa.array(chosen + [None] * match_nulls, type=pa.string())
+    if not pa.types.is_dictionary(values.type):
+        return pc.is_in(values, value_set=value_set)
+    # Test each distinct reason once, then spread the result over the rows.
+    chunks = [
+        pc.fill_null(
+            pc.take(pc.is_in(chunk.dictionary, value_set=value_set), chunk.indices),
+            match_nulls,
+        )
+        for chunk in values.chunks
+    ]
+    return pa.chunked_array(chunks, type=pa.bool_())
+
+
+def _reason_counts(table: pa.Table, column: str, *, limit: int | None = None) -> list[tuple[str, int]]:
+    """Count reasons with Arrow's hash kernel, most frequent first; nulls count as UNKNOWN."""
+    if column not in table.column_names or table.num_rows == 0:
+        return []
+    counts = pc.value_counts(_reason_values(table, column))
+    totals: dict[str, int] = {}
+    for value, count in zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist()):
+        reason = "UNKNOWN" if value is None else value
+        totals[reason] = totals.get(reason, 0) + count
+    pairs = sorted(totals.items(), key=lambda pair: pair[1], reverse=True)
     if limit is not None:
-        counts = counts.head(limit)
-    return counts
+        pairs = pairs[:limit]
+    return pairs
 
 
-def _top_reason_summary(df: pd.DataFrame, column: str, heading: str) -> html.Div:
-    counts = _reason_counts(df, column, limit=_TOP_REASON_LIMIT)
-    if counts.empty:
+def _top_reason_summary(table: pa.Table, column: str, heading: str) -> html.Div:
+    counts = _reason_counts(table, column, limit=_TOP_REASON_LIMIT)
+    if not counts:
         return _empty_message(f"No {heading.lower()} yet.")
 
     items = [
         html.Li(f"{reason}: {count:,}")
-        for reason, count in counts.items()
+        for reason, count in counts
     ]
 
     return html.Div(
@@ -228,28 +635,31 @@ def _top_reason_summary(df: pd.DataFrame, column: str, heading: str) -> html.Div
     )
 
 
-def _reason_filter_options(df: pd.DataFrame, column: str) -> list[dict]:
-    counts = _reason_counts(df, column)
+def _reason_filter_options(table: pa.Table, column: str) -> list[dict]:
+    counts = _reason_counts(table, column)
     return [
         {"label": f"{reason} ({count:,})", "value": reason}
-        for reason, count in counts.items()
+        for reason, count in counts
     ]
 
 
+def _chosen_reasons(selected_values: Iterable[str] | None, valid_values: Iterable[str]) -> list[str]:
+    allowed = set(str(value) for value in valid_values)
+    return [value for value in (selected_values or []) if value in allowed]
+
+
 def _filter_by_reason(
-    df: pd.DataFrame,
+    table: pa.Table,
     column: str,
     selected_values: Iterable[str] | None,
     valid_values: Iterable[str],
-) -> pd.DataFrame:
-    if column not in df.columns or not selected_values:
-        return df
-    allowed = set(str(value) for value in valid_values)
-    chosen = [value for value in (selected_values or []) if value in allowed]
+) -> pa.Table:
+    if column not in table.column_names or not selected_values:
+        return table
+    chosen = _chosen_reasons(selected_values, valid_values)
     if not chosen:
-        return df
-    series = df[column].fillna("UNKNOWN").astype(str)
-    return df[series.isin(chosen)]
+        return table
+    return table.filter(_reason_mask(_reason_values(table, column), chosen))
 
 
 def create_app() -> Dash:
@@ -422,9 +832,12 @@ def create_app() -> Dash:
                                 id="anomaly-table",
                                 data=[],
                                 columns=[],
-                                page_size=25,
-                                sort_action="native",
-                                filter_action="native",
+                                page_current=0,
+                                page_size=_TABLE_PAGE_SIZE,
+                                page_action="custom",
+                                sort_action="custom",
+                                sort_mode="multi",
+                                sort_by=[],
                                 style_table={"overflowX": "auto"},
                                 style_cell={"textAlign": "left", "padding": "0.25rem"},
                             ),
@@ -451,9 +864,12 @@ def create_app() -> Dash:
                                 id="rejected-table",
                                 data=[],
                                 columns=[],
-                                page_size=25,
-                                sort_action="native",
-                                filter_action="native",
+                                page_current=0,
+                                page_size=_TABLE_PAGE_SIZE,
+                                page_action="custom",
+                                sort_action="custom",
+                                sort_mode="multi",
+                                sort_by=[],
                                 style_table={"overflowX": "auto"},
                                 style_cell={"textAlign": "left", "padding": "0.25rem"},
                             ),
@@ -497,19 +913,14 @@ def create_app() -> Dash:
                 chart_metric_style,
             )
 
-        df = _load_parquet(path)
-        summary = _summarise_dataframe(df, path)
-        data, columns = _dataframe_preview(df)
-        
-        # Create figure with custom handling for specific files
-        if path.name == "top_categories.parquet":
-            figure = _create_top_categories_figure(df)
-        elif path.name == _TOP_PRODUCTS_BY_CATEGORY_FILENAME:
-            # Use default metric (total_revenue) for initial load
-            figure = _create_top_products_by_category_figure(df, "total_revenue")
-        else:
-            figure = _default_figure(df, path.stem)
-            
+        # Summary and preview come from the footer and first row group; the
+        # full file is only materialised (and cached) when the chart is built.
+        schema, num_rows, head = _parquet_overview(path)
+        summary = _summarise_schema(schema, num_rows, path)
+        data, columns = _arrow_preview(head)
+
+        # Top categories/products pick their default metric when none is given
+        figure = _aggregation_figure(path)
         if figure is None:
             figure = _empty_figure("Add numeric columns to visualise this aggregation")
 
@@ -517,7 +928,7 @@ def create_app() -> Dash:
             category_style = {"marginBottom": "1rem"}
             
         # Show chart metric controls for files that support multiple metrics
-        if path.name in ["top_categories.parquet", _TOP_PRODUCTS_BY_CATEGORY_FILENAME]:
+        if path.name in [_TOP_CATEGORIES_FILENAME, _TOP_PRODUCTS_BY_CATEGORY_FILENAME]:
             chart_metric_style = {"marginBottom": "1rem"}
 
         return summary, data, columns, figure, category_style, chart_metric_style
@@ -536,19 +947,18 @@ def create_app() -> Dash:
         if not path.exists():
             raise PreventUpdate
             
-        df = _load_parquet(path)
-        if df.empty:
+        # The footer has the row count and column names; no data is read.
+        metadata = pq.read_metadata(path)
+        if metadata.num_rows == 0:
             raise PreventUpdate
             
         # Handle different file types
-        if path.name == "top_categories.parquet":
-            if selected_metric not in df.columns:
+        if path.name == _TOP_CATEGORIES_FILENAME:
+            if selected_metric not in metadata.schema.names:
                 raise PreventUpdate
-            figure = _create_dynamic_top_categories_figure(df, selected_metric)
-        elif path.name == _TOP_PRODUCTS_BY_CATEGORY_FILENAME:
-            figure = _create_top_products_by_category_figure(df, selected_metric)
-        else:
+        elif path.name != _TOP_PRODUCTS_BY_CATEGORY_FILENAME:
             raise PreventUpdate
+        figure = _aggregation_figure(path, selected_metric)
             
         return figure if figure else _empty_figure("Unable to create chart")
 
@@ -565,10 +975,7 @@ def create_app() -> Dash:
         path = Path(selected_value)
         if path.name != _TOP_PRODUCTS_BY_CATEGORY_FILENAME or not path.exists():
             return [], None
-        df = _load_parquet(path)
-        if df.empty or "category" not in df.columns:
-            return [], None
-        categories = sorted(df["category"].dropna().astype(str).unique().tolist())
+        categories = _parquet_unique_values(path, "category")
         if not categories:
             return [], None
         options = [{"label": category, "value": category} for category in categories]
@@ -597,27 +1004,28 @@ def create_app() -> Dash:
         path = Path(selected_value)
         if path.name != _TOP_PRODUCTS_BY_CATEGORY_FILENAME or not path.exists():
             return [], [], _empty_figure("Top products by category file not found")
-        df = _load_parquet(path)
+        df = _load_parquet(path, columns=_CATEGORY_TABLE_COLUMNS)
         if df.empty:
             return [], [], _empty_figure("No data available")
         metric = selected_metric if selected_metric in {"revenue", "units"} else "revenue"
-        metric_df = df[df["metric_type"] == metric].copy()
+        metric_df = df[df["metric_type"] == metric]
         if metric_df.empty:
             return [], [], _empty_figure(f"No {metric} data available")
-        metric_df = metric_df.sort_values(["category", "rank"]).reset_index(drop=True)
 
         DEFAULT_PER_CATEGORY = 3
         if selected_category:
-            filtered = metric_df[metric_df["category"].astype(str) == selected_category]
             limit = DEFAULT_PER_CATEGORY
             if isinstance(top_n, (int, float)):
                 try:
                     limit = max(1, int(top_n))
                 except (TypeError, ValueError):
                     limit = DEFAULT_PER_CATEGORY
-            filtered = filtered.head(limit)
+            filtered = metric_df[metric_df["category"] == selected_category].nsmallest(limit, "rank")
         else:
-            filtered = metric_df.groupby("category", group_keys=False).head(DEFAULT_PER_CATEGORY)
+            # Ranks are assigned 1..N per category by the aggregation build, so a
+            # single vectorised mask selects the top rows of every category.
+            filtered = metric_df[metric_df["rank"] <= DEFAULT_PER_CATEGORY].sort_values(["category", "rank"])
+        filtered = filtered.reset_index(drop=True)
 
         # Create chart
         if filtered.empty:
@@ -651,66 +1059,106 @@ def create_app() -> Dash:
         columns = [{"name": str(col), "id": str(col)} for col in filtered.columns]
         return data, columns, figure
 
+    # Summaries and reason options only change when the file does, so they are
+    # computed separately from the table, which reacts to filter/page/sort.
     @app.callback(
         Output("anomaly-summary", "children"),
         Output("anomaly-reason-summary", "children"),
         Output("anomaly-reason-filter", "options"),
+        Input("refresh-data", "n_clicks"),
+    )
+    def _update_anomaly_overview(_: int):
+        anomaly_path = AGGREGATIONS_DIR / _ANOMALY_FILENAME
+        if not anomaly_path.exists():
+            message = _empty_message("No anomaly records parquet found yet.")
+            return message, message, []
+        schema, num_rows, _ = _parquet_overview(anomaly_path)
+        summary = _summarise_schema(schema, num_rows, anomaly_path)
+        table = _load_parquet_table(anomaly_path, ["anomaly_reason"])
+        reason_summary = _top_reason_summary(table, "anomaly_reason", "Top anomaly reasons")
+        options = _reason_filter_options(table, "anomaly_reason")
+        return summary, reason_summary, options
+
+    @app.callback(
         Output("anomaly-table", "data"),
         Output("anomaly-table", "columns"),
+        Output("anomaly-table", "page_count"),
+        Input("anomaly-reason-filter", "options"),
         Input("anomaly-reason-filter", "value"),
-        Input("refresh-data", "n_clicks"),
+        Input("anomaly-table", "page_current"),
+        Input("anomaly-table", "page_size"),
+        Input("anomaly-table", "sort_by"),
     )
-    def _update_anomalies(selected_reasons: list[str] | None, _: int):
+    def _update_anomaly_table(
+        options: list[dict] | None,
+        selected_reasons: list[str] | None,
+        page_current: int | None,
+        page_size: int | None,
+        sort_by: list[dict] | None,
+    ):
         anomaly_path = AGGREGATIONS_DIR / _ANOMALY_FILENAME
         if not anomaly_path.exists():
-            message = _empty_message("No anomaly records parquet found yet.")
-            return message, message, [], [], []
-        df = _load_parquet(anomaly_path)
-        summary = _summarise_dataframe(df, anomaly_path)
-        reason_summary = _top_reason_summary(df, "anomaly_reason", "Top anomaly reasons")
-        options = _reason_filter_options(df, "anomaly_reason")
-        selected = selected_reasons or []
-        filtered = _filter_by_reason(
-            df,
-            "anomaly_reason",
-            selected,
-            (option["value"] for option in options),
-        )
-        data, columns = _dataframe_preview(filtered)
-        return summary, reason_summary, options, data, columns
+            return [], [], 1
+        chosen = _chosen_reasons(selected_reasons, (option["value"] for option in options or []))
+        if chosen:
+            table = _load_parquet_filtered(anomaly_path, "anomaly_reason", chosen)
+        else:
+            table = _load_parquet_table(anomaly_path)
+        return _table_page(table, page_current, page_size, sort_by)
 
     @app.callback(
         Output("rejected-summary", "children"),
         Output("rejected-reason-summary", "children"),
         Output("rejected-reason-filter", "options"),
-        Output("rejected-table", "data"),
-        Output("rejected-table", "columns"),
         Input("rejected-selector", "value"),
-        Input("rejected-reason-filter", "value"),
         Input("refresh-data", "n_clicks"),
     )
-    def _update_rejected(selected_value: str | None, selected_reasons: list[str] | None, _: int):
+    def _update_rejected_overview(selected_value: str | None, _: int):
         if not selected_value:
             message = _empty_message("No rejected orders selected.")
-            return message, message, [], [], []
+            return message, message, []
         path = Path(selected_value)
         if not path.exists():
             message = f"{path.name} is missing. Run the cleaning pipeline with rejected output enabled."
             empty = _empty_message(message)
-            return empty, empty, [], [], []
-        df = _load_csv(path)
-        summary = _summarise_dataframe(df, path)
-        reason_summary = _top_reason_summary(df, "rejection_reason", "Top rejection reasons")
-        options = _reason_filter_options(df, "rejection_reason")
-        selected = selected_reasons or []
+            return empty, empty, []
+        table = _load_csv(path)
+        summary = _summarise_schema(table.schema, table.num_rows, path)
+        reason_summary = _top_reason_summary(table, _REJECTION_REASON_COLUMN, "Top rejection reasons")
+        options = _reason_filter_options(table, _REJECTION_REASON_COLUMN)
+        return summary, reason_summary, options
+
+    @app.callback(
+        Output("rejected-table", "data"),
+        Output("rejected-table", "columns"),
+        Output("rejected-table", "page_count"),
+        Input("rejected-reason-filter", "options"),
+        Input("rejected-reason-filter", "value"),
+        Input("rejected-table", "page_current"),
+        Input("rejected-table", "page_size"),
+        Input("rejected-table", "sort_by"),
+        State("rejected-selector", "value"),
+    )
+    def _update_rejected_table(
+        options: list[dict] | None,
+        selected_reasons: list[str] | None,
+        page_current: int | None,
+        page_size: int | None,
+        sort_by: list[dict] | None,
+        selected_value: str | None,
+    ):
+        if not selected_value:
+            return [], [], 1
+        path = Path(selected_value)
+        if not path.exists():
+            return [], [], 1
         filtered = _filter_by_reason(
-            df,
-            "rejection_reason",
-            selected,
-            (option["value"] for option in options),
+            _load_csv(path),
+            _REJECTION_REASON_COLUMN,
+            selected_reasons or [],
+            (option["value"] for option in options or []),
         )
-        data, columns = _dataframe_preview(filtered)
-        return summary, reason_summary, options, data, columns
+        return _table_page(filtered, page_current, page_size, sort_by)
 
     @app.callback(
         Output("aggregation-selector", "value"),
@@ -725,7 +1173,7 @@ def create_app() -> Dash:
             
         # Only handle clicks on top_categories charts
         current_path = Path(current_aggregation)
-        if current_path.name != "top_categories.parquet":
+        if current_path.name != _TOP_CATEGORIES_FILENAME:
             raise PreventUpdate
             
         # Extract category from click data
@@ -734,16 +1182,14 @@ def create_app() -> Dash:
             clicked_category = click_data["points"][0]["x"]
             
             # Find the top_products_by_category file
-            top_products_by_category_path = None
-            for path in _list_parquet_files(AGGREGATIONS_DIR):
-                if path.name == _TOP_PRODUCTS_BY_CATEGORY_FILENAME:
-                    top_products_by_category_path = str(path)
-                    break
+            top_products_by_category_path = _parquet_index(AGGREGATIONS_DIR).get(
+                _TOP_PRODUCTS_BY_CATEGORY_FILENAME
+            )
             
-            if not top_products_by_category_path:
+            if top_products_by_category_path is None:
                 raise PreventUpdate
                 
-            return top_products_by_category_path, clicked_category
+            return str(top_products_by_category_path), clicked_category
             
         except (KeyError, IndexError, TypeError):
             # If we can't extract the category, don't update
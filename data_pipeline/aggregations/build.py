@@ -2,21 +2,20 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Callable, Dict, Mapping, Iterator
+from collections.abc import Sequence
+from typing import Callable, Mapping, Iterator, Protocol
 import logging
-import heapq
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 import pyarrow.parquet as pq
 import pyarrow as pa
 
-# Configure PyArrow to use single CPU core
-pa.set_cpu_count(1)
-pa.set_io_thread_count(1)
-
 from data_pipeline.settings import AGGREGATIONS_DIR, ensure_directories
 
+logger = logging.getLogger(__name__)
+
 _EMPTY_SCHEMAS: Mapping[str, list[str]] = {
     "monthly_sales_summary": [
         "month",
@@ -62,241 +61,478 @@ _EMPTY_SCHEMAS: Mapping[str, list[str]] = {
     ],
 }
 
+# Arrow types of the aggregation columns, so empty outputs keep the same
+# schema as populated ones instead of untyped null columns.
+_COLUMN_TYPES: Mapping[str, pa.DataType] = {
+    "month": pa.string(),
+    "category": pa.string(),
+    "product_name": pa.string(),
+    "region": pa.string(),
+    "order_id": pa.string(),
+    "metric_type": pa.string(),
+    "anomaly_reason": pa.string(),
+    "rank": pa.int64(),
+    "quantity": pa.int64(),
+    "total_quantity": pa.int64(),
+    "order_count": pa.int64(),
+    "revenue": pa.float64(),
+    "unit_price": pa.float64(),
+    "discount_percent": pa.float64(),
+    "total_revenue": pa.float64(),
+    "avg_discount_percent": pa.float64(),
+    "avg_order_value": pa.float64(),
+    "sale_date": pa.timestamp("ns"),
+}
+
+_AGGREGATION_ROW_GROUP_SIZE = 10_000
+
+# Chunks between compactions of the chunked builders' partial aggregates.
+_PARTIAL_COMPACT_EVERY = 32
+
+_EMPTY_ARROW_SCHEMAS: Mapping[str, pa.Schema] = {
+    name: pa.schema([(column, _COLUMN_TYPES[column]) for column in columns])
+    for name, columns in _EMPTY_SCHEMAS.items()
+}
+
 
-def _iter_parquet_chunks(clean_path: Path, batch_size: int = 1_000_000) -> Iterator[pd.DataFrame]:
-    """Iterate over parquet file in chunks to avoid loading entire dataset into memory."""
-    parquet_file = pq.ParquetFile(clean_path)
+# Types the builders compute with; sale_date is stored as unix seconds.
+_CLEAN_COLUMN_TYPES: Mapping[str, pa.DataType] = {
+    "sale_date": pa.timestamp("s"),
+    "discount_percent": pa.float64(),
+    "quantity": pa.float64(),
+    "revenue": pa.float64(),
+}
+
+
+# Low-cardinality label columns the chunked builders group on.
+_DICTIONARY_COLUMNS = ("category", "product_name", "region")
+
+
+def _coerce_clean_types(table: pa.Table) -> pa.Table:
+    """Cast the cleaned columns the builders compute with, where the stored type differs."""
+    for name, target in _CLEAN_COLUMN_TYPES.items():
+        index = table.schema.get_field_index(name)
+        if index < 0:
+            continue
+        column = table.column(index)
+        if pa.types.is_timestamp(column.type) and pa.types.is_timestamp(target):
+            continue
+        if column.type != target:
+            table = table.set_column(index, name, column.cast(target))
+    return table
+
+
+def _iter_parquet_chunks(
+    clean_path: Path,
+    batch_size: int = 1_000_000,
+    columns: Sequence[str] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Iterate over parquet file in chunks to avoid loading entire dataset into memory.
+
+    Only ``columns`` are read when given, so unused column chunks are never
+    decompressed.
+    """
+    # Keep the label columns dictionary-encoded so they arrive as Categoricals
+    # and the builders group on integer codes rather than strings.
+    available = set(pq.read_schema(clean_path).names)
+    parquet_file = pq.ParquetFile(
+        clean_path,
+        read_dictionary=[name for name in _DICTIONARY_COLUMNS if name in available],
+    )
     total_rows = parquet_file.metadata.num_rows
-    logger = logging.getLogger(__name__)
     
     processed_rows = 0
-    for batch_num, batch in enumerate(parquet_file.iter_batches(batch_size=batch_size), 1):
-        # Convert arrow batch to pandas DataFrame
-        df = batch.to_pandas()
-        
-        if df.empty:
+    milestones = iter((10, 25, 50, 75, 90))
+    next_milestone = next(milestones, None)
+    for batch_num, batch in enumerate(parquet_file.iter_batches(batch_size=batch_size, columns=columns), 1):
+        if batch.num_rows == 0:
             continue
-            
+        
+        # Ensure correct dtypes for downstream calculations, casting in Arrow
+        # so the pandas conversion is the only copy. sale_date stays in
+        # seconds: the int64 values are reinterpreted, not rescaled, and the
+        # accumulators only truncate it to months or carry it through.
+        df = _coerce_clean_types(pa.Table.from_batches([batch])).to_pandas(
+            split_blocks=True,
+            self_destruct=True,
+        )
+        
         processed_rows += len(df)
         progress_pct = (processed_rows / total_rows) * 100
         
-        # Log progress every 5 batches or at key milestones
-        if batch_num % 5 == 0 or progress_pct in [10, 25, 50, 75, 90]:
+        # Log progress every 5 batches or when crossing a key milestone
+        crossed = next_milestone is not None and progress_pct >= next_milestone
+        while next_milestone is not None and progress_pct >= next_milestone:
+            next_milestone = next(milestones, None)
+        if batch_num % 5 == 0 or crossed:
             logger.info(f"  Progress: {processed_rows:,}/{total_rows:,} rows ({progress_pct:.1f}%) - Batch {batch_num}")
-            
-        # Ensure correct dtypes for downstream calculations
-        df["sale_date"] = pd.to_datetime(df["sale_date"], unit="s", errors="coerce")
-        df["discount_percent"] = df["discount_percent"].astype(float)
-        df["quantity"] = df["quantity"].astype(float) 
-        df["revenue"] = df["revenue"].astype(float)
         
         yield df
 
 
 def _load_clean_data(clean_path: Path) -> pd.DataFrame:
     """Legacy function - kept for backward compatibility but not recommended for large files."""
-    frame = pd.read_parquet(clean_path)
-    if frame.empty:
-        return frame
+    table = pq.read_table(clean_path, memory_map=True)
+    if table.num_rows == 0:
+        return table.to_pandas()
     # Ensure we have the correct dtypes for downstream calculations.
-    frame["sale_date"] = pd.to_datetime(frame["sale_date"], unit="s", errors="coerce")
-    frame["discount_percent"] = frame["discount_percent"].astype(float)
-    frame["quantity"] = frame["quantity"].astype(float)
-    frame["revenue"] = frame["revenue"].astype(float)
+    frame = _coerce_clean_types(table).to_pandas(
+        split_blocks=True,
+        self_destruct=True,
+        coerce_temporal_nanoseconds=True,
+    )
+    del table
+    frame["order_id_hash"] = _order_id_hashes(frame["order_id"])
     return frame
 
 
-def _monthly_sales_summary_chunked(parquet_path: Path) -> pd.DataFrame:
+def _order_id_hashes(order_id: pd.Series) -> pd.Series:
+    """Hash order ids to 64-bit integers, NA where the id is null.
+
+    Distinct order counts then hash integers rather than Python strings.
+    """
+    hashes = pd.util.hash_array(order_id.to_numpy(dtype=object))
+    return pd.Series(hashes, index=order_id.index, dtype="UInt64").mask(order_id.isna().to_numpy())
+
+
+def _read_ahead(chunks: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """Yield from ``chunks`` while the following item is produced on another thread.
+
+    Parquet decoding and the Arrow-to-pandas conversion release the GIL, so
+    reading overlaps with the caller's work on the current chunk.
+    """
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending = reader.submit(next, chunks, None)
+        while True:
+            chunk = pending.result()
+            if chunk is None:
+                return
+            pending = reader.submit(next, chunks, None)
+            yield chunk
+
+
+class _Accumulator(Protocol):
+    """Folds cleaned chunks into one aggregation frame."""
+
+    # Cleaned columns the accumulator reads from each chunk.
+    columns: Sequence[str]
+
+    def update(self, chunk: pd.DataFrame) -> None: ...
+
+    def finalize(self) -> pd.DataFrame: ...
+
+
+def _stream_aggregations(
+    parquet_path: Path,
+    accumulators: Mapping[str, _Accumulator],
+) -> dict[str, pd.DataFrame]:
+    """Feed every accumulator from a single read of ``parquet_path``.
+
+    Only the union of the accumulators' columns is read. The next chunk is
+    read and converted on a background thread while the accumulators fold
+    the current one in turn on this thread, so no two of them touch a chunk
+    at once.
+    """
+    columns = list(dict.fromkeys(column for acc in accumulators.values() for column in acc.columns))
+    for chunk in _read_ahead(_iter_parquet_chunks(parquet_path, columns=columns)):
+        for accumulator in accumulators.values():
+            accumulator.update(chunk)
+    return {name: accumulator.finalize() for name, accumulator in accumulators.items()}
+
+
+def _stream_aggregation(parquet_path: Path, accumulator: _Accumulator) -> pd.DataFrame:
+    return _stream_aggregations(parquet_path, {"result": accumulator})["result"]
+
+
+class _PartialAggregates:
+    """Per-chunk partial aggregates indexed by group key, reduced with one groupby.
+
+    Partials are compacted every ``_PARTIAL_COMPACT_EVERY`` chunks so memory
+    stays proportional to the number of groups, not chunks.
+    """
+
+    def __init__(self) -> None:
+        self.partials: list[pd.DataFrame] = []
+
+    def add(self, partial: pd.DataFrame) -> None:
+        self.partials.append(partial)
+        if len(self.partials) >= _PARTIAL_COMPACT_EVERY:
+            self.partials = [self.total()]
+
+    def total(self) -> pd.DataFrame | None:
+        if not self.partials:
+            return None
+        combined = pd.concat(self.partials)
+        return combined.groupby(level=list(combined.index.names), sort=False, observed=True).sum()
+
+
+class _DistinctOrders:
+    """Distinct order ids per group across chunks, held as 64-bit hashes.
+
+    Each chunk contributes its distinct (group, order hash) pairs, which are
+    deduplicated again on compaction, so memory follows the distinct pairs
+    rather than the rows.
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        self.keys = list(keys)
+        self.pairs: list[pd.DataFrame] = []
+
+    def add(self, chunk: pd.DataFrame) -> None:
+        """Record the pairs of ``chunk``, which holds the key columns and ``order_id``."""
+        pairs = chunk[self.keys].assign(order_id_hash=_order_id_hashes(chunk["order_id"]))
+        self.pairs.append(pairs.dropna().drop_duplicates())
+        if len(self.pairs) >= _PARTIAL_COMPACT_EVERY:
+            self.pairs = [self._combined()]
+
+    def _combined(self) -> pd.DataFrame:
+        return pd.concat(self.pairs, ignore_index=True).drop_duplicates()
+
+    def attach(self, totals: pd.DataFrame) -> pd.DataFrame:
+        """Join the ``order_count`` of each group onto ``totals``, indexed by the keys."""
+        if self.pairs:
+            counts = self._combined().groupby(self.keys, sort=False, observed=True).size()
+        else:
+            counts = pd.Series(dtype="int64")
+        joined = totals.join(counts.rename("order_count"))
+        return joined.fillna({"order_count": 0}).astype({"order_count": "int64"})
+
+
+def _sum_by_code(codes: np.ndarray, values: np.ndarray, ngroups: int) -> np.ndarray:
+    """Per-group sums of ``values`` for dense integer group ``codes``, skipping NaNs.
+
+    ``np.bincount`` runs the ``out[code] += value`` loop in C, without the
+    hashing and sorting a groupby does to find the groups.
+    """
+    weights = values.astype(np.float64, copy=False)
+    nan = np.isnan(weights)
+    if nan.any():
+        weights = np.where(nan, 0.0, weights)
+    return np.bincount(codes, weights=weights, minlength=ngroups)
+
+
+def _count_by_code(codes: np.ndarray, mask: np.ndarray, ngroups: int) -> np.ndarray:
+    """Per-group counts of the rows where ``mask`` is set."""
+    return np.bincount(codes[mask], minlength=ngroups)
+
+
+class _MonthlySalesAccumulator:
     """Chunked monthly sales summary: Revenue, quantity, avg discount by month"""
-    logger = logging.getLogger(__name__)
-    logger.info("Building monthly sales summary (chunked)...")
-    
-    monthly_totals = defaultdict(lambda: {
-        'total_revenue': 0.0,
-        'total_quantity': 0.0,
-        'discount_sum': 0.0,
-        'discount_count': 0,
-        'order_ids': set()
-    })
-    
-    total_rows = 0
-    for chunk_num, chunk in enumerate(_iter_parquet_chunks(parquet_path), 1):
-        total_rows += len(chunk)
+
+    columns = ("sale_date", "revenue", "quantity", "discount_percent", "order_id")
+
+    def __init__(self) -> None:
+        logger.info("Building monthly sales summary (chunked)...")
+        self.partials = _PartialAggregates()
+        self.orders = _DistinctOrders(["month"])
+        self.total_rows = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.total_rows += len(chunk)
         
-        # Extract month from sale_date
-        chunk = chunk.copy()
-        chunk['month'] = chunk['sale_date'].dt.strftime('%Y-%m')
+        # Key on months since the epoch; labels are formatted once per month
+        # after all chunks are reduced.
+        months = chunk['sale_date'].to_numpy().astype('datetime64[M]')
+        valid = ~np.isnat(months)
+        if not valid.any():
+            return
+        ordinals = months[valid].view('int64')
+        first = ordinals.min()
+        codes = ordinals - first
+        ngroups = int(codes.max()) + 1
         
-        # Aggregate by month within this chunk
-        for month, group in chunk.groupby('month'):
-            monthly_totals[month]['total_revenue'] += group['revenue'].sum()
-            monthly_totals[month]['total_quantity'] += group['quantity'].sum()
-            monthly_totals[month]['discount_sum'] += (group['discount_percent'] * len(group)).sum()
-            monthly_totals[month]['discount_count'] += len(group)
-            monthly_totals[month]['order_ids'].update(group['order_id'].tolist())
+        sizes = np.bincount(codes, minlength=ngroups)
+        present = np.flatnonzero(sizes)
         
-        # Progress logging is now handled by _iter_parquet_chunks
-    
-    # Convert to final DataFrame
-    result_data = []
-    for month, data in monthly_totals.items():
-        avg_discount = data['discount_sum'] / data['discount_count'] if data['discount_count'] > 0 else 0
-        result_data.append({
-            'month': month,
-            'total_revenue': round(data['total_revenue'], 2),
-            'total_quantity': int(data['total_quantity']),
-            'avg_discount_percent': round(avg_discount, 4),
-            'order_count': len(data['order_ids'])
-        })
-    
-    result = pd.DataFrame(result_data).sort_values('month')
-    logger.info(f"Generated monthly summary for {len(result)} months from {total_rows:,} rows")
-    return result
+        def column_sum(column: str) -> np.ndarray:
+            return _sum_by_code(codes, chunk[column].to_numpy()[valid], ngroups)[present]
+        
+        partial = pd.DataFrame(
+            {
+                'total_revenue': column_sum('revenue'),
+                'total_quantity': column_sum('quantity'),
+                'discount_sum': column_sum('discount_percent'),
+                'discount_count': _count_by_code(codes, chunk['discount_percent'].notna().to_numpy()[valid], ngroups)[present],
+            },
+            index=pd.Index(first + present, name='month'),
+        )
+        self.partials.add(partial)
+        self.orders.add(pd.DataFrame({'month': ordinals, 'order_id': chunk['order_id'].to_numpy()[valid]}))
+
+    def finalize(self) -> pd.DataFrame:
+        totals = self.partials.total()
+        if totals is None:
+            return pd.DataFrame(columns=_EMPTY_SCHEMAS["monthly_sales_summary"])
+        
+        result = self.orders.attach(totals).reset_index()
+        result['month'] = np.datetime_as_string(result['month'].to_numpy().astype('datetime64[M]'), unit='M')
+        result['avg_discount_percent'] = result['discount_sum'] / result['discount_count']
+        result = (
+            result.round({'total_revenue': 2, 'avg_discount_percent': 4})
+            .astype({'total_quantity': int})
+            .sort_values('month')[_EMPTY_SCHEMAS["monthly_sales_summary"]]
+        )
+        logger.info(
+            f"Generated monthly summary for {len(result)} months from {self.total_rows:,} rows"
+        )
+        return result
+
+
+def _monthly_sales_summary_chunked(parquet_path: Path) -> pd.DataFrame:
+    """Chunked monthly sales summary: Revenue, quantity, avg discount by month"""
+    return _stream_aggregation(parquet_path, _MonthlySalesAccumulator())
+
+
+def _sales_rollup(df: pd.DataFrame) -> pd.DataFrame:
+    """Pre-aggregate to one row per month, category, product and region.
+
+    The in-memory builders roll this frame up further instead of each
+    rescanning every row. Distinct order counts do not add up across groups,
+    so the builders count them separately with ``_distinct_order_counts``.
+    """
+    # Group on monthly periods; only the few output labels are formatted.
+    month = df["sale_date"].dt.to_period("M").rename("month")
+    return (
+        df.groupby([month, "category", "product_name", "region"], dropna=False, sort=False, observed=True)
+        .agg(
+            total_revenue=("revenue", "sum"),
+            total_quantity=("quantity", "sum"),
+            discount_sum=("discount_percent", "sum"),
+            discount_count=("discount_percent", "count"),
+        )
+        .reset_index()
+    )
+
 
+def _distinct_order_counts(orders: pd.DataFrame, keys) -> pd.Series:
+    """Distinct ``order_id_hash`` values of ``orders`` per group of ``keys``."""
+    return orders.groupby(keys, observed=True)["order_id_hash"].nunique().rename("order_count")
 
-def _monthly_sales_summary(df: pd.DataFrame) -> pd.DataFrame:
+
+def _monthly_sales_summary(rollup: pd.DataFrame, orders: pd.DataFrame) -> pd.DataFrame:
     """Monthly sales summary: Revenue, quantity, avg discount by month (legacy)"""
-    logger = logging.getLogger(__name__)
     logger.info("Building monthly sales summary...")
     
-    # Extract month from sale_date
-    df = df.copy()
-    df['month'] = df['sale_date'].dt.strftime('%Y-%m')
-    
     grouped = (
-        df.groupby("month")
+        rollup.groupby("month")
         .agg(
-            total_revenue=("revenue", "sum"),
-            total_quantity=("quantity", "sum"),
-            avg_discount_percent=("discount_percent", "mean"),
-            order_count=("order_id", "nunique"),
+            total_revenue=("total_revenue", "sum"),
+            total_quantity=("total_quantity", "sum"),
+            discount_sum=("discount_sum", "sum"),
+            discount_count=("discount_count", "sum"),
         )
+        .join(_distinct_order_counts(orders, orders["sale_date"].dt.to_period("M").rename("month")))
         .reset_index()
     )
+    grouped["avg_discount_percent"] = grouped["discount_sum"] / grouped["discount_count"]
+    grouped["month"] = grouped["month"].dt.strftime("%Y-%m")
     
     # Round values for readability
-    grouped["total_revenue"] = grouped["total_revenue"].round(2)
-    grouped["total_quantity"] = grouped["total_quantity"].astype(int)
-    grouped["avg_discount_percent"] = grouped["avg_discount_percent"].round(4)
+    grouped = grouped.round({"total_revenue": 2, "avg_discount_percent": 4}).astype({"total_quantity": int})
     
-    result = grouped.sort_values("month")
+    result = grouped.sort_values("month")[_EMPTY_SCHEMAS["monthly_sales_summary"]]
     logger.info(f"Generated monthly summary for {len(result)} months")
     return result
 
 
 
 
-def _top_products_by_category_chunked(parquet_path: Path, limit: int = 5) -> pd.DataFrame:
-    """Chunked best sellers per category by revenue and units."""
-    logger = logging.getLogger(__name__)
-    logger.info("Building category best sellers (chunked)...")
+def _ranked_top_products(grouped: pd.DataFrame, limit: int) -> list[pd.DataFrame]:
+    """Top ``limit`` products of each category by revenue and by units, ranked from 1."""
+    result_frames = []
+    for category, group in grouped.groupby("category", observed=True):
+        for column, metric_type in (("total_revenue", "revenue"), ("total_quantity", "units")):
+            top = _largest_rows(group, column, limit)
+            result_frames.append(top.assign(rank=np.arange(1, len(top) + 1), metric_type=metric_type))
+    return result_frames
 
-    category_product_totals = defaultdict(
-        lambda: {"total_revenue": 0.0, "total_quantity": 0.0, "order_ids": set()}
-    )
 
-    total_rows = 0
-    for chunk_num, chunk in enumerate(_iter_parquet_chunks(parquet_path), 1):
-        total_rows += len(chunk)
+class _TopProductsAccumulator:
+    """Chunked best sellers per category by revenue and units."""
 
-        for (category, product), group in chunk.groupby(["category", "product_name"]):
-            entry = category_product_totals[(category, product)]
-            entry["total_revenue"] += group["revenue"].sum()
-            entry["total_quantity"] += group["quantity"].sum()
-            entry["order_ids"].update(group["order_id"].tolist())
+    columns = ("category", "product_name", "revenue", "quantity", "order_id")
 
-    if not category_product_totals:
-        return pd.DataFrame(columns=_EMPTY_SCHEMAS["top_products_by_category"])
+    def __init__(self, limit: int = 5) -> None:
+        logger.info("Building category best sellers (chunked)...")
+        self.limit = limit
+        self.partials = _PartialAggregates()
+        self.orders = _DistinctOrders(["category", "product_name"])
+        self.total_rows = 0
 
-    aggregated = pd.DataFrame(
-        {
-            "category": category,
-            "product_name": product,
-            "total_revenue": data["total_revenue"],
-            "total_quantity": data["total_quantity"],
-            "order_count": len(data["order_ids"]),
-        }
-        for (category, product), data in category_product_totals.items()
-    )
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.total_rows += len(chunk)
+        self.partials.add(
+            chunk.groupby(["category", "product_name"], sort=False, observed=True).agg(
+                total_revenue=("revenue", "sum"),
+                total_quantity=("quantity", "sum"),
+            )
+        )
+        self.orders.add(chunk)
 
-    result_frames = []
-    for category, group in aggregated.groupby("category"):
-        top_by_revenue = group.nlargest(limit, "total_revenue").copy()
-        top_by_revenue["rank"] = range(1, len(top_by_revenue) + 1)
-        top_by_revenue["metric_type"] = "revenue"
+    def finalize(self) -> pd.DataFrame:
+        limit = self.limit
+        totals = self.partials.total()
+        if totals is None or totals.empty:
+            return pd.DataFrame(columns=_EMPTY_SCHEMAS["top_products_by_category"])
 
-        top_by_units = group.nlargest(limit, "total_quantity").copy()
-        top_by_units["rank"] = range(1, len(top_by_units) + 1)
-        top_by_units["metric_type"] = "units"
+        aggregated = self.orders.attach(totals).reset_index()
 
-        result_frames.append(top_by_revenue)
-        result_frames.append(top_by_units)
+        result_frames = _ranked_top_products(aggregated, limit)
 
-    if not result_frames:
-        return pd.DataFrame(columns=_EMPTY_SCHEMAS["top_products_by_category"])
+        if not result_frames:
+            return pd.DataFrame(columns=_EMPTY_SCHEMAS["top_products_by_category"])
 
-    result = pd.concat(result_frames, ignore_index=True)
-    result["total_revenue"] = result["total_revenue"].round(2)
-    result["total_quantity"] = result["total_quantity"].astype(int)
+        result = pd.concat(result_frames, ignore_index=True)
+        result = result.round({"total_revenue": 2}).astype({"total_quantity": int})
 
-    logger.info(
-        "Generated category best sellers for %d categories from %s rows",
-        aggregated["category"].nunique(),
-        f"{total_rows:,}",
-    )
+        logger.info(
+            "Generated category best sellers for %d categories from %s rows",
+            aggregated["category"].nunique(),
+            f"{self.total_rows:,}",
+        )
 
-    return result[
-        [
-            "category",
-            "rank",
-            "product_name",
-            "total_revenue",
-            "total_quantity",
-            "order_count",
-            "metric_type",
+        return result[
+            [
+                "category",
+                "rank",
+                "product_name",
+                "total_revenue",
+                "total_quantity",
+                "order_count",
+                "metric_type",
+            ]
         ]
-    ]
 
 
+def _top_products_by_category_chunked(parquet_path: Path, limit: int = 5) -> pd.DataFrame:
+    """Chunked best sellers per category by revenue and units."""
+    return _stream_aggregation(parquet_path, _TopProductsAccumulator(limit))
 
 
-def _top_products_by_category(df: pd.DataFrame, limit: int = 5) -> pd.DataFrame:
+def _top_products_by_category(rollup: pd.DataFrame, orders: pd.DataFrame, limit: int = 5) -> pd.DataFrame:
     """Best sellers per category by revenue and units."""
-    logger = logging.getLogger(__name__)
     logger.info("Building category best sellers...")
 
     grouped = (
-        df.groupby(["category", "product_name"])
+        rollup.groupby(["category", "product_name"], observed=True)
         .agg(
-            total_revenue=("revenue", "sum"),
-            total_quantity=("quantity", "sum"),
-            order_count=("order_id", "nunique"),
+            total_revenue=("total_revenue", "sum"),
+            total_quantity=("total_quantity", "sum"),
         )
+        .join(_distinct_order_counts(orders, ["category", "product_name"]))
         .reset_index()
     )
 
     if grouped.empty:
         return pd.DataFrame(columns=_EMPTY_SCHEMAS["top_products_by_category"])
 
-    result_frames = []
-    for category, group in grouped.groupby("category"):
-        top_by_revenue = group.sort_values("total_revenue", ascending=False).head(limit).copy()
-        top_by_revenue["rank"] = range(1, len(top_by_revenue) + 1)
-        top_by_revenue["metric_type"] = "revenue"
-
-        top_by_units = group.sort_values("total_quantity", ascending=False).head(limit).copy()
-        top_by_units["rank"] = range(1, len(top_by_units) + 1)
-        top_by_units["metric_type"] = "units"
-
-        result_frames.append(top_by_revenue)
-        result_frames.append(top_by_units)
+    result_frames = _ranked_top_products(grouped, limit)
 
     if not result_frames:
         return pd.DataFrame(columns=_EMPTY_SCHEMAS["top_products_by_category"])
 
     result = pd.concat(result_frames, ignore_index=True)
-    result["total_revenue"] = result["total_revenue"].round(2)
-    result["total_quantity"] = result["total_quantity"].astype(int)
+    result = result.round({"total_revenue": 2}).astype({"total_quantity": int})
 
     logger.info(
         "Generated category best sellers for %d categories",
@@ -316,218 +552,252 @@ def _top_products_by_category(df: pd.DataFrame, limit: int = 5) -> pd.DataFrame:
     ]
 
 
-def _region_wise_performance_chunked(parquet_path: Path) -> pd.DataFrame:
+class _RegionPerformanceAccumulator:
     """Chunked sales performance by region"""
-    logger = logging.getLogger(__name__)
-    logger.info("Building region-wise performance (chunked)...")
-    
-    region_totals = defaultdict(lambda: {
-        'total_revenue': 0.0,
-        'total_quantity': 0.0,
-        'order_ids': set()
-    })
-    
-    total_rows = 0
-    for chunk_num, chunk in enumerate(_iter_parquet_chunks(parquet_path), 1):
-        total_rows += len(chunk)
-        
-        # Aggregate by region within this chunk
-        for region, group in chunk.groupby('region'):
-            region_totals[region]['total_revenue'] += group['revenue'].sum()
-            region_totals[region]['total_quantity'] += group['quantity'].sum()
-            region_totals[region]['order_ids'].update(group['order_id'].tolist())
+
+    columns = ("region", "revenue", "quantity", "order_id")
+
+    def __init__(self) -> None:
+        logger.info("Building region-wise performance (chunked)...")
+        self.partials = _PartialAggregates()
+        self.orders = _DistinctOrders(["region"])
+        self.total_rows = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.total_rows += len(chunk)
+        self.partials.add(
+            chunk.groupby('region', sort=False, observed=True).agg(
+                total_revenue=('revenue', 'sum'),
+                total_quantity=('quantity', 'sum'),
+            )
+        )
+        self.orders.add(chunk)
+
+    def finalize(self) -> pd.DataFrame:
+        totals = self.partials.total()
+        if totals is None:
+            return pd.DataFrame(columns=_EMPTY_SCHEMAS["region_wise_performance"])
         
-        # Progress logging is now handled by _iter_parquet_chunks
-    
-    # Convert to final DataFrame
-    result_data = []
-    for region, data in region_totals.items():
-        order_count = len(data['order_ids'])
-        avg_order_value = data['total_revenue'] / order_count if order_count > 0 else 0
-        result_data.append({
-            'region': region,
-            'total_revenue': round(data['total_revenue'], 2),
-            'total_quantity': int(data['total_quantity']),
-            'order_count': order_count,
-            'avg_order_value': round(avg_order_value, 2)
-        })
-    
-    result = pd.DataFrame(result_data).sort_values('total_revenue', ascending=False)
-    logger.info(f"Generated performance metrics for {len(result)} regions from {total_rows:,} rows")
-    return result
+        result = self.orders.attach(totals).reset_index()
+        result['avg_order_value'] = (result['total_revenue'] / result['order_count']).where(
+            result['order_count'] > 0, 0.0
+        )
+        result = (
+            result.round({'total_revenue': 2, 'avg_order_value': 2})
+            .astype({'total_quantity': int})
+            .sort_values('total_revenue', ascending=False)[_EMPTY_SCHEMAS["region_wise_performance"]]
+        )
+        logger.info(
+            f"Generated performance metrics for {len(result)} regions from {self.total_rows:,} rows"
+        )
+        return result
 
 
-def _region_wise_performance(df: pd.DataFrame) -> pd.DataFrame:
+def _region_wise_performance_chunked(parquet_path: Path) -> pd.DataFrame:
+    """Chunked sales performance by region"""
+    return _stream_aggregation(parquet_path, _RegionPerformanceAccumulator())
+
+
+def _region_wise_performance(rollup: pd.DataFrame, orders: pd.DataFrame) -> pd.DataFrame:
     """Sales performance by region (legacy)"""
-    logger = logging.getLogger(__name__)
     logger.info("Building region-wise performance...")
     
     grouped = (
-        df.groupby("region")
+        rollup.groupby("region", observed=True)
         .agg(
-            total_revenue=("revenue", "sum"),
-            total_quantity=("quantity", "sum"),
-            order_count=("order_id", "nunique"),
+            total_revenue=("total_revenue", "sum"),
+            total_quantity=("total_quantity", "sum"),
         )
+        .join(_distinct_order_counts(orders, "region"))
         .reset_index()
     )
     
     # Calculate average order value
-    grouped["avg_order_value"] = (grouped["total_revenue"] / grouped["order_count"]).round(2)
+    grouped["avg_order_value"] = grouped["total_revenue"] / grouped["order_count"]
     
     # Round values
-    grouped["total_revenue"] = grouped["total_revenue"].round(2)
-    grouped["total_quantity"] = grouped["total_quantity"].astype(int)
+    grouped = grouped.round({"total_revenue": 2, "avg_order_value": 2}).astype({"total_quantity": int})
     
     result = grouped.sort_values("total_revenue", ascending=False)
     logger.info(f"Generated performance metrics for {len(result)} regions")
     return result
 
 
-def _top_categories_chunked(parquet_path: Path) -> pd.DataFrame:
+class _TopCategoriesAccumulator:
     """Chunked average discount by category"""
-    logger = logging.getLogger(__name__)
-    logger.info("Building category discount mapping (chunked)...")
-    
-    category_totals = defaultdict(lambda: {
-        'discount_sum': 0.0,
-        'discount_count': 0,
-        'total_revenue': 0.0,
-        'order_ids': set()
-    })
-    
-    total_rows = 0
-    for chunk_num, chunk in enumerate(_iter_parquet_chunks(parquet_path), 1):
-        total_rows += len(chunk)
-        
-        # Aggregate by category within this chunk
-        for category, group in chunk.groupby('category'):
-            category_totals[category]['discount_sum'] += (group['discount_percent'] * len(group)).sum()
-            category_totals[category]['discount_count'] += len(group)
-            category_totals[category]['total_revenue'] += group['revenue'].sum()
-            category_totals[category]['order_ids'].update(group['order_id'].tolist())
+
+    columns = ("category", "discount_percent", "revenue", "order_id")
+
+    def __init__(self) -> None:
+        logger.info("Building category discount mapping (chunked)...")
+        self.partials = _PartialAggregates()
+        self.orders = _DistinctOrders(["category"])
+        self.total_rows = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.total_rows += len(chunk)
+        # Sum and non-null count reduce exactly across chunks to the mean the
+        # in-memory builder reports.
+        self.partials.add(
+            chunk.groupby('category', sort=False, observed=True).agg(
+                discount_sum=('discount_percent', 'sum'),
+                discount_count=('discount_percent', 'count'),
+                total_revenue=('revenue', 'sum'),
+            )
+        )
+        self.orders.add(chunk)
+
+    def finalize(self) -> pd.DataFrame:
+        totals = self.partials.total()
+        if totals is None:
+            return pd.DataFrame(columns=_EMPTY_SCHEMAS["top_categories"])
         
-        # Progress logging is now handled by _iter_parquet_chunks
-    
-    # Convert to final DataFrame
-    result_data = []
-    for category, data in category_totals.items():
-        avg_discount = data['discount_sum'] / data['discount_count'] if data['discount_count'] > 0 else 0
-        result_data.append({
-            'category': category,
-            'avg_discount_percent': round(avg_discount, 4),
-            'order_count': len(data['order_ids']),
-            'total_revenue': round(data['total_revenue'], 2)
-        })
-    
-    result = pd.DataFrame(result_data).sort_values('avg_discount_percent', ascending=False)
-    logger.info(f"Generated discount mapping for {len(result)} categories from {total_rows:,} rows")
-    return result
+        result = self.orders.attach(totals).reset_index()
+        result['avg_discount_percent'] = result['discount_sum'] / result['discount_count']
+        result = (
+            result.round({'avg_discount_percent': 4, 'total_revenue': 2})
+            .sort_values('avg_discount_percent', ascending=False)[_EMPTY_SCHEMAS["top_categories"]]
+        )
+        logger.info(
+            f"Generated discount mapping for {len(result)} categories from {self.total_rows:,} rows"
+        )
+        return result
 
 
-def _anomaly_records_chunked(parquet_path: Path, limit: int = 5) -> pd.DataFrame:
+def _top_categories_chunked(parquet_path: Path) -> pd.DataFrame:
+    """Chunked average discount by category"""
+    return _stream_aggregation(parquet_path, _TopCategoriesAccumulator())
+
+
+class _AnomalyRecordsAccumulator:
     """Chunked anomaly records with extremely high revenue or extremely high discounts"""
-    logger = logging.getLogger(__name__)
-    logger.info("Identifying anomaly records (chunked)...")
-    
-    # Use heaps to track top records efficiently
-    top_revenue_heap = []  # min heap for top revenue records
-    top_discount_heap = []  # min heap for top discount records
-    
-    total_rows = 0
-    for chunk_num, chunk in enumerate(_iter_parquet_chunks(parquet_path), 1):
-        total_rows += len(chunk)
-        
-        # Process top revenue records in this chunk
-        chunk_top_revenue = chunk.nlargest(limit, 'revenue')
-        for idx, row in chunk_top_revenue.iterrows():
-            if len(top_revenue_heap) < limit:
-                heapq.heappush(top_revenue_heap, (row['revenue'], idx, row.to_dict()))
-            elif row['revenue'] > top_revenue_heap[0][0]:
-                heapq.heapreplace(top_revenue_heap, (row['revenue'], idx, row.to_dict()))
-        
-        # Process top discount records in this chunk
-        chunk_top_discount = chunk.nlargest(limit, 'discount_percent')
-        for idx, row in chunk_top_discount.iterrows():
-            if len(top_discount_heap) < limit:
-                heapq.heappush(top_discount_heap, (row['discount_percent'], idx, row.to_dict()))
-            elif row['discount_percent'] > top_discount_heap[0][0]:
-                heapq.heapreplace(top_discount_heap, (row['discount_percent'], idx, row.to_dict()))
-        
-        # Progress logging is now handled by _iter_parquet_chunks
-    
-    # Convert heaps to DataFrames
-    top_revenue_records = [record for _, _, record in top_revenue_heap]
-    top_discount_records = [record for _, _, record in top_discount_heap]
-    
-    top_revenue_df = pd.DataFrame(top_revenue_records)
-    top_revenue_df["anomaly_reason"] = "high_revenue"
+
+    columns = (
+        "order_id", "product_name", "category", "region",
+        "revenue", "quantity", "unit_price", "discount_percent", "sale_date",
+    )
+
+    def __init__(self, limit: int = 5) -> None:
+        logger.info("Identifying anomaly records (chunked)...")
+        self.limit = limit
+        # Running top-``limit`` rows, kept as small frames rather than per-row dicts
+        self.top_revenue: pd.DataFrame | None = None
+        self.top_discount: pd.DataFrame | None = None
+        self.total_rows = 0
+
+    def _merge_top(self, current: pd.DataFrame | None, candidates: pd.DataFrame, column: str) -> pd.DataFrame:
+        if current is not None:
+            # Earlier rows come first so ties keep the first-seen record.
+            candidates = pd.concat([current, candidates], ignore_index=True)
+        return _largest_rows(candidates, column, self.limit)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.total_rows += len(chunk)
+        # Gather the rows that can enter either ranking into one compact frame,
+        # so each column of the chunk is sliced once rather than per ranking.
+        positions = np.union1d(
+            _largest_positions(chunk['revenue'].to_numpy(dtype=float), self.limit),
+            _largest_positions(chunk['discount_percent'].to_numpy(dtype=float), self.limit),
+        )
+        candidates = chunk.iloc[positions]
+        self.top_revenue = self._merge_top(self.top_revenue, candidates, 'revenue')
+        self.top_discount = self._merge_top(self.top_discount, candidates, 'discount_percent')
+
+    def finalize(self) -> pd.DataFrame:
+        if self.top_revenue is None:
+            return pd.DataFrame(columns=_EMPTY_SCHEMAS["anomaly_records"])
     
-    top_discount_df = pd.DataFrame(top_discount_records)
-    top_discount_df["anomaly_reason"] = "high_discount"
+        top_revenue_df = self.top_revenue.assign(anomaly_reason="high_revenue")
+        top_discount_df = self.top_discount.assign(anomaly_reason="high_discount")
     
-    # Combine and deduplicate
-    all_anomalies = pd.concat([top_revenue_df, top_discount_df], ignore_index=True)
-    all_anomalies = all_anomalies.drop_duplicates(subset=['order_id'], keep='first')
-    all_anomalies = all_anomalies.head(limit)
+        # Combine and deduplicate
+        all_anomalies = pd.concat([top_revenue_df, top_discount_df], ignore_index=True)
+        all_anomalies = all_anomalies.drop_duplicates(subset=['order_id'], keep='first')
+        all_anomalies = all_anomalies.head(self.limit)
     
-    # Add rank and format
-    all_anomalies["rank"] = range(1, len(all_anomalies) + 1)
+        # Add rank and format
+        all_anomalies["rank"] = range(1, len(all_anomalies) + 1)
     
-    columns = [
-        "rank", "order_id", "product_name", "category", "region",
-        "revenue", "quantity", "unit_price", "discount_percent", "sale_date", "anomaly_reason"
-    ]
+        columns = [
+            "rank", "order_id", "product_name", "category", "region",
+            "revenue", "quantity", "unit_price", "discount_percent", "sale_date", "anomaly_reason"
+        ]
     
-    result = all_anomalies[columns].copy()
-    result["revenue"] = result["revenue"].round(2)
-    result["unit_price"] = result["unit_price"].round(2)
-    result["discount_percent"] = result["discount_percent"].round(4)
-    result["quantity"] = result["quantity"].astype(int)
+        result = (
+            all_anomalies[columns]
+            .round({"revenue": 2, "unit_price": 2, "discount_percent": 4})
+            .astype({"quantity": int, "sale_date": "datetime64[ns]"})
+        )
     
-    revenue_count = len(result[result["anomaly_reason"] == "high_revenue"])
-    discount_count = len(result[result["anomaly_reason"] == "high_discount"])
-    logger.info(f"Identified {len(result)} anomaly records: {revenue_count} high revenue, {discount_count} high discount from {total_rows:,} rows")
+        revenue_count = len(result[result["anomaly_reason"] == "high_revenue"])
+        discount_count = len(result[result["anomaly_reason"] == "high_discount"])
+        logger.info(f"Identified {len(result)} anomaly records: {revenue_count} high revenue, {discount_count} high discount from {self.total_rows:,} rows")
     
-    return result
+        return result
 
 
-def _top_categories(df: pd.DataFrame) -> pd.DataFrame:
+def _anomaly_records_chunked(parquet_path: Path, limit: int = 5) -> pd.DataFrame:
+    """Chunked anomaly records with extremely high revenue or extremely high discounts"""
+    return _stream_aggregation(parquet_path, _AnomalyRecordsAccumulator(limit))
+
+
+def _top_categories(rollup: pd.DataFrame, orders: pd.DataFrame) -> pd.DataFrame:
     """Average discount by category (legacy)"""
-    logger = logging.getLogger(__name__)
     logger.info("Building category discount mapping...")
     
     grouped = (
-        df.groupby("category")
+        rollup.groupby("category", observed=True)
         .agg(
-            avg_discount_percent=("discount_percent", "mean"),
-            order_count=("order_id", "nunique"),
-            total_revenue=("revenue", "sum"),
+            discount_sum=("discount_sum", "sum"),
+            discount_count=("discount_count", "sum"),
+            total_revenue=("total_revenue", "sum"),
         )
+        .join(_distinct_order_counts(orders, "category"))
         .reset_index()
     )
+    grouped["avg_discount_percent"] = grouped["discount_sum"] / grouped["discount_count"]
+    grouped = grouped[["category", "avg_discount_percent", "order_count", "total_revenue"]]
     
     # Round values
-    grouped["avg_discount_percent"] = grouped["avg_discount_percent"].round(4)
-    grouped["total_revenue"] = grouped["total_revenue"].round(2)
+    grouped = grouped.round({"avg_discount_percent": 4, "total_revenue": 2})
     
     result = grouped.sort_values("avg_discount_percent", ascending=False)
     logger.info(f"Generated discount mapping for {len(result)} categories")
     return result
 
 
+def _largest_rows(df: pd.DataFrame, column: str, limit: int) -> pd.DataFrame:
+    """Return the ``limit`` rows with the largest ``column``, like ``nlargest``."""
+    return df.iloc[_largest_positions(df[column].to_numpy(dtype=float), limit)]
+
+
+def _largest_positions(values: np.ndarray, limit: int) -> np.ndarray:
+    """Positions of the ``limit`` largest ``values``, largest first.
+
+    ``np.argpartition`` selects the candidates in linear time so only ``limit``
+    values are sorted; NaNs are skipped and ties keep their original order.
+    """
+    positions = np.flatnonzero(~np.isnan(values))
+    if limit <= 0:
+        positions = positions[:0]
+    elif len(positions) > limit:
+        positions = positions[np.argpartition(values[positions], -limit)[-limit:]]
+        # Widen to every row tied with the cut-off so ties resolve by position.
+        threshold = values[positions].min()
+        positions = np.flatnonzero(values >= threshold)
+    order = np.lexsort((positions, -values[positions]))
+    return positions[order][:limit]
+
+
 def _anomaly_records(df: pd.DataFrame, limit: int = 5) -> pd.DataFrame:
     """Anomaly records with extremely high revenue or extremely high discounts (legacy)"""
-    logger = logging.getLogger(__name__)
     logger.info("Identifying anomaly records...")
     
     # Get top records by revenue
-    top_revenue = df.nlargest(limit, 'revenue').copy()
-    top_revenue["anomaly_reason"] = "high_revenue"
+    top_revenue = _largest_rows(df, "revenue", limit).assign(anomaly_reason="high_revenue")
     
     # Get top records by discount percentage
-    top_discount = df.nlargest(limit, 'discount_percent').copy()
-    top_discount["anomaly_reason"] = "high_discount"
+    top_discount = _largest_rows(df, "discount_percent", limit).assign(anomaly_reason="high_discount")
     
     # Combine both types of anomalies
     all_anomalies = pd.concat([top_revenue, top_discount], ignore_index=True)
@@ -547,13 +817,12 @@ def _anomaly_records(df: pd.DataFrame, limit: int = 5) -> pd.DataFrame:
         "revenue", "quantity", "unit_price", "discount_percent", "sale_date", "anomaly_reason"
     ]
     
-    result = all_anomalies[columns].copy()
-    
     # Round values
-    result["revenue"] = result["revenue"].round(2)
-    result["unit_price"] = result["unit_price"].round(2)
-    result["discount_percent"] = result["discount_percent"].round(4)
-    result["quantity"] = result["quantity"].astype(int)
+    result = (
+        all_anomalies[columns]
+        .round({"revenue": 2, "unit_price": 2, "discount_percent": 4})
+        .astype({"quantity": int})
+    )
     
     revenue_count = len(result[result["anomaly_reason"] == "high_revenue"])
     discount_count = len(result[result["anomaly_reason"] == "high_discount"])
@@ -562,16 +831,19 @@ def _anomaly_records(df: pd.DataFrame, limit: int = 5) -> pd.DataFrame:
     return result
 
 
-# Chunked aggregation builders for large datasets (uses PyArrow streaming)
-_CHUNKED_AGGREGATION_BUILDERS: Mapping[str, Callable[..., pd.DataFrame]] = {
-    "monthly_sales_summary": _monthly_sales_summary_chunked,
-    "top_products_by_category": _top_products_by_category_chunked,
-    "region_wise_performance": _region_wise_performance_chunked,
-    "top_categories": _top_categories_chunked,
-    "anomaly_records": _anomaly_records_chunked,
+# Chunked aggregation accumulators for large datasets (uses PyArrow streaming).
+# All five are fed from a single pass over the parquet file.
+_CHUNKED_ACCUMULATORS: Mapping[str, Callable[..., _Accumulator]] = {
+    "monthly_sales_summary": _MonthlySalesAccumulator,
+    "top_products_by_category": _TopProductsAccumulator,
+    "region_wise_performance": _RegionPerformanceAccumulator,
+    "top_categories": _TopCategoriesAccumulator,
+    "anomaly_records": _AnomalyRecordsAccumulator,
 }
 
-# Legacy aggregation builders for smaller datasets (loads all data into memory)
+# Legacy aggregation builders for smaller datasets (loads all data into memory).
+# All but anomaly_records take the shared ``_sales_rollup`` frame plus the
+# cleaned rows, from which they count distinct orders.
 _AGGREGATION_BUILDERS: Mapping[str, Callable[..., pd.DataFrame]] = {
     "monthly_sales_summary": _monthly_sales_summary,
     "top_products_by_category": _top_products_by_category,
@@ -581,6 +853,69 @@ _AGGREGATION_BUILDERS: Mapping[str, Callable[..., pd.DataFrame]] = {
 }
 
 
+# Engines accepted by ``build_all_aggregations``; polars is an optional dependency.
+_ENGINES = ("pandas", "polars")
+
+
+def _normalise_aggregation_types(table: pa.Table) -> pa.Table:
+    """Cast every column to its ``_COLUMN_TYPES`` type.
+
+    The engines produce different physical types for the same columns:
+    dictionary labels from the dictionary-encoded cleaned data, Polars'
+    microsecond timestamps, narrowed integers. Casting here keeps each
+    artefact's schema independent of the engine and of the chunking.
+    """
+    for index, field in enumerate(table.schema):
+        target = _COLUMN_TYPES.get(field.name)
+        if target is None and pa.types.is_dictionary(field.type):
+            target = field.type.value_type
+        if target is not None and field.type != target:
+            table = table.set_column(index, pa.field(field.name, target), table.column(index).cast(target))
+    return table
+
+
+def _write_aggregation(data: pd.DataFrame | pa.Table, artefact: Path) -> None:
+    """Write an aggregation with the options the dashboard's reads rely on.
+
+    Dictionary encoding and ZSTD keep the repeated label columns small, and
+    per-row-group statistics let filtered reads skip row groups.
+    """
+    table = _normalise_aggregation_types(
+        data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    )
+    pq.write_table(
+        table,
+        artefact,
+        compression="zstd",
+        compression_level=3,
+        use_dictionary=True,
+        write_statistics=True,
+        row_group_size=_AGGREGATION_ROW_GROUP_SIZE,
+    )
+
+
+def _build_and_write(
+    builder: Callable[..., pd.DataFrame],
+    source: pd.DataFrame,
+    artefact: Path,
+    **kwargs,
+) -> tuple[int, Path]:
+    data = builder(source, **kwargs)
+    _write_aggregation(data, artefact)
+    return len(data), artefact
+
+
+def _write_empty_aggregations(output: Path) -> dict[str, Path]:
+    """Write a typed, zero-row parquet file for every aggregation."""
+    generated: dict[str, Path] = {}
+    for name, schema in _EMPTY_ARROW_SCHEMAS.items():
+        artefact = output / f"{name}.parquet"
+        _write_aggregation(schema.empty_table(), artefact)
+        generated[name] = artefact
+        logger.info(f"Generated empty aggregation: {artefact}")
+    return generated
+
+
 def build_all_aggregations(
     clean_parquet: Path,
     output_dir: Path | None = None,
@@ -589,7 +924,8 @@ def build_all_aggregations(
     anomaly_limit: int = 5,
     force_chunked: bool = False,
     chunk_threshold_gb: float = 1.0,
-) -> Dict[str, Path]:
+    engine: str = "pandas",
+) -> dict[str, Path]:
     """Compute all supported aggregations from the cleaned dataset.
     
     Automatically uses chunked processing for large files to avoid memory issues.
@@ -600,6 +936,8 @@ def build_all_aggregations(
         anomaly_limit: Number of anomaly records to identify
         force_chunked: Force chunked processing regardless of file size
         chunk_threshold_gb: File size threshold (GB) to trigger chunked processing
+        engine: "pandas", or "polars" to run every aggregation as a streaming
+            Polars plan (requires the optional polars dependency)
     
     Generates the following aggregation files:
     - monthly_sales_summary.parquet: Revenue, quantity, avg discount by month
@@ -608,7 +946,9 @@ def build_all_aggregations(
     - top_categories.parquet: Top categories by various metrics
     - anomaly_records.parquet: Top N records with extremely high revenue
     """
-    logger = logging.getLogger(__name__)
+    
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown aggregation engine {engine!r}; expected one of {', '.join(_ENGINES)}")
     
     ensure_directories()
     output = output_dir or AGGREGATIONS_DIR
@@ -620,90 +960,97 @@ def build_all_aggregations(
     
     logger.info(f"Input file: {clean_parquet}")
     logger.info(f"File size: {file_size_gb:.2f} GB")
-    logger.info(f"Processing strategy: {'Chunked (PyArrow)' if use_chunked else 'In-memory (pandas)'}")
+    if engine == "polars":
+        logger.info("Processing strategy: Streaming (Polars)")
+    else:
+        logger.info(f"Processing strategy: {'Chunked (PyArrow)' if use_chunked else 'In-memory (pandas)'}")
     
-    # Check if file is empty
-    if file_size_gb < 0.001:  # Less than 1MB - likely empty
-        logger.warning("Input data appears empty, generating empty aggregation files")
-        generated: Dict[str, Path] = {}
-        for name in _AGGREGATION_BUILDERS:
-            artefact = output / f"{name}.parquet"
-            pd.DataFrame(columns=_EMPTY_SCHEMAS[name]).to_parquet(artefact, index=False)
-            generated[name] = artefact
-            logger.info(f"Generated empty aggregation: {artefact}")
-        return generated
-    
-    # Choose appropriate builders based on file size
-    builders = _CHUNKED_AGGREGATION_BUILDERS if use_chunked else _AGGREGATION_BUILDERS
-    
-    if use_chunked:
-        logger.info("Using chunked processing for large dataset")
-        results: Dict[str, Path] = {}
-        total_aggregations = len(builders)
+    # The footer holds the row count, so empty inputs are detected without reading data
+    if pq.ParquetFile(clean_parquet).metadata.num_rows == 0:
+        logger.warning("Input data is empty, generating empty aggregation files")
+        return _write_empty_aggregations(output)
+    
+    if engine == "polars" or use_chunked:
+        import time
+        start_time = time.time()
         
-        for agg_num, (name, builder) in enumerate(builders.items(), 1):
-            logger.info(f"[{agg_num}/{total_aggregations}] Building aggregation: {name}")
-            
-            import time
-            start_time = time.time()
-            
-            # Pass appropriate arguments to chunked functions
-            if name == "top_products_by_category":
-                data = builder(clean_parquet, limit=top_products_limit)
-            elif name == "anomaly_records":
-                data = builder(clean_parquet, limit=anomaly_limit)
-            else:
-                data = builder(clean_parquet)
+        if engine == "polars":
+            from .polars_builders import build_polars_aggregations
             
-            elapsed = time.time() - start_time
+            frames = build_polars_aggregations(
+                clean_parquet,
+                top_products_limit=top_products_limit,
+                anomaly_limit=anomaly_limit,
+            )
+        else:
+            logger.info("Using chunked processing for large dataset")
             
+            # Pass appropriate arguments to the accumulators
+            accumulators: dict[str, _Accumulator] = {}
+            for name, factory in _CHUNKED_ACCUMULATORS.items():
+                if name == "top_products_by_category":
+                    accumulators[name] = factory(limit=top_products_limit)
+                elif name == "anomaly_records":
+                    accumulators[name] = factory(limit=anomaly_limit)
+                else:
+                    accumulators[name] = factory()
+            frames = _stream_aggregations(clean_parquet, accumulators)
+        
+        elapsed = time.time() - start_time
+        logger.info(f"Aggregated {len(frames)} outputs in a single pass in {elapsed:.1f}s")
+        
+        results: dict[str, Path] = {}
+        for name, data in frames.items():
             artefact = output / f"{name}.parquet"
-            data.to_parquet(artefact, index=False)
+            _write_aggregation(data, artefact)
             results[name] = artefact
             
             # Log aggregation stats
             file_size_kb = artefact.stat().st_size / 1024
-            logger.info(f"✅ Completed {name}: {len(data):,} rows, {file_size_kb:.1f} KB in {elapsed:.1f}s -> {artefact}")
-            
-            if agg_num < total_aggregations:
-                logger.info(f"📊 Overall progress: {agg_num}/{total_aggregations} aggregations complete")
+            logger.info(f"✅ Completed {name}: {len(data):,} rows, {file_size_kb:.1f} KB -> {artefact}")
     
     else:
         logger.info("Using in-memory processing for smaller dataset")
         frame = _load_clean_data(clean_parquet)
         
-        if frame.empty:
-            logger.warning("Input data is empty, generating empty aggregation files")
-            generated: Dict[str, Path] = {}
-            for name in _AGGREGATION_BUILDERS:
-                artefact = output / f"{name}.parquet"
-                pd.DataFrame(columns=_EMPTY_SCHEMAS[name]).to_parquet(artefact, index=False)
-                generated[name] = artefact
-                logger.info(f"Generated empty aggregation: {artefact}")
-            return generated
-
         logger.info(f"Processing {len(frame):,} records from cleaned data")
         logger.info(f"Data date range: {frame['sale_date'].min()} to {frame['sale_date'].max()}")
         
-        results: Dict[str, Path] = {}
-        for name, builder in builders.items():
-            logger.info(f"Building aggregation: {name}")
-            
-            # Pass appropriate limits to functions that need them
-            if name == "top_products_by_category":
-                data = builder(frame, limit=top_products_limit)
-            elif name == "anomaly_records":
-                data = builder(frame, limit=anomaly_limit)
-            else:
-                data = builder(frame)
+        # The builders only read their inputs, so they run on a thread pool;
+        # pandas and Arrow release the GIL in their groupby, sort and write
+        # kernels. anomaly_records scans the full frame and is submitted
+        # first so it overlaps the shared rollup.
+        builders = _AGGREGATION_BUILDERS
+        with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+            logger.info("Building aggregation: anomaly_records")
+            futures = {
+                "anomaly_records": executor.submit(
+                    _build_and_write,
+                    builders["anomaly_records"],
+                    frame,
+                    output / "anomaly_records.parquet",
+                    limit=anomaly_limit,
+                )
+            }
+            rollup = _sales_rollup(frame)
+            for name, builder in builders.items():
+                if name in futures:
+                    continue
+                logger.info(f"Building aggregation: {name}")
+                # Pass appropriate limits to functions that need them
+                kwargs = {"limit": top_products_limit} if name == "top_products_by_category" else {}
+                futures[name] = executor.submit(
+                    _build_and_write, builder, rollup, output / f"{name}.parquet", orders=frame, **kwargs
+                )
             
-            artefact = output / f"{name}.parquet"
-            data.to_parquet(artefact, index=False)
-            results[name] = artefact
-            
-            # Log aggregation stats
-            file_size_kb = artefact.stat().st_size / 1024
-            logger.info(f"Saved {name}: {len(data):,} rows, {file_size_kb:.1f} KB -> {artefact}")
+            results: dict[str, Path] = {}
+            for name in builders:
+                row_count, artefact = futures[name].result()
+                results[name] = artefact
+                
+                # Log aggregation stats
+                file_size_kb = artefact.stat().st_size / 1024
+                logger.info(f"Saved {name}: {row_count:,} rows, {file_size_kb:.1f} KB -> {artefact}")
 
     logger.info(f"Successfully generated {len(results)} aggregation files in {output}")
     return results
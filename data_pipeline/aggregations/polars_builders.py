@@ -0,0 +1,168 @@
+"""Polars implementation of the aggregation builders.
+
+Each aggregation is a lazy plan over ``pl.scan_parquet``; the five plans are
+collected together on the streaming engine so the scan is shared and the
+group-bys run multi-threaded without materialising the dataset in memory.
+Rows with a null group key are left out of that aggregation, as pandas
+group-bys do. Requires the optional ``polars`` dependency.
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+_LABEL_COLUMNS = ("category", "product_name", "region")
+
+
+def _scan_clean_data(clean_path: Path) -> pl.LazyFrame:
+    """Scan the cleaned parquet with the types the builders compute with."""
+    scan = pl.scan_parquet(clean_path)
+    schema = scan.collect_schema()
+
+    # sale_date is stored as unix seconds; use the nanosecond unit the
+    # pandas engine writes.
+    if schema["sale_date"].is_integer():
+        sale_date = pl.from_epoch("sale_date", time_unit="s")
+    else:
+        sale_date = pl.col("sale_date")
+
+    return scan.with_columns(
+        sale_date.cast(pl.Datetime("ns")).alias("sale_date"),
+        pl.col(*_LABEL_COLUMNS).cast(pl.String),
+        pl.col("discount_percent", "quantity", "revenue").cast(pl.Float64),
+    )
+
+
+def _monthly_sales_summary(scan: pl.LazyFrame) -> pl.LazyFrame:
+    return (
+        scan.drop_nulls("sale_date")
+        .group_by(pl.col("sale_date").dt.truncate("1mo").alias("month"))
+        .agg(
+            total_revenue=pl.col("revenue").sum().round(2),
+            total_quantity=pl.col("quantity").sum().cast(pl.Int64),
+            avg_discount_percent=pl.col("discount_percent").mean().round(4),
+            order_count=pl.col("order_id").drop_nulls().n_unique().cast(pl.Int64),
+        )
+        .sort("month")
+        .with_columns(pl.col("month").dt.strftime("%Y-%m"))
+    )
+
+
+def _top_products_by_category(scan: pl.LazyFrame, limit: int) -> pl.LazyFrame:
+    totals = scan.drop_nulls(["category", "product_name"]).group_by("category", "product_name").agg(
+        total_revenue=pl.col("revenue").sum(),
+        total_quantity=pl.col("quantity").sum(),
+        order_count=pl.col("order_id").drop_nulls().n_unique().cast(pl.Int64),
+    )
+
+    def ranked(metric: str, metric_type: str) -> pl.LazyFrame:
+        return (
+            totals.sort(metric, descending=True, maintain_order=True)
+            .with_columns(rank=pl.int_range(pl.len(), dtype=pl.Int64).over("category") + 1)
+            .filter(pl.col("rank") <= limit)
+            .with_columns(metric_type=pl.lit(metric_type))
+        )
+
+    return (
+        pl.concat([ranked("total_revenue", "revenue"), ranked("total_quantity", "units")])
+        .sort("category", "metric_type", "rank")
+        .select(
+            "category",
+            "rank",
+            "product_name",
+            pl.col("total_revenue").round(2),
+            pl.col("total_quantity").cast(pl.Int64),
+            "order_count",
+            "metric_type",
+        )
+    )
+
+
+def _region_wise_performance(scan: pl.LazyFrame) -> pl.LazyFrame:
+    return (
+        scan.drop_nulls("region")
+        .group_by("region")
+        .agg(
+            total_revenue=pl.col("revenue").sum(),
+            total_quantity=pl.col("quantity").sum().cast(pl.Int64),
+            order_count=pl.col("order_id").drop_nulls().n_unique().cast(pl.Int64),
+        )
+        .with_columns(
+            avg_order_value=pl.when(pl.col("order_count") > 0)
+            .then(pl.col("total_revenue") / pl.col("order_count"))
+            .otherwise(0.0)
+            .round(2),
+            total_revenue=pl.col("total_revenue").round(2),
+        )
+        .sort("total_revenue", descending=True)
+        .select("region", "total_revenue", "total_quantity", "order_count", "avg_order_value")
+    )
+
+
+def _top_categories(scan: pl.LazyFrame) -> pl.LazyFrame:
+    return (
+        scan.drop_nulls("category")
+        .group_by("category")
+        .agg(
+            avg_discount_percent=pl.col("discount_percent").mean().round(4),
+            order_count=pl.col("order_id").drop_nulls().n_unique().cast(pl.Int64),
+            total_revenue=pl.col("revenue").sum().round(2),
+        )
+        .sort("avg_discount_percent", descending=True)
+    )
+
+
+def _anomaly_records(scan: pl.LazyFrame, limit: int) -> pl.LazyFrame:
+    def largest(column: str, reason: str) -> pl.LazyFrame:
+        # Sort followed by head is planned as a top-k; NaNs and nulls are skipped.
+        return (
+            scan.filter(pl.col(column).is_not_null() & pl.col(column).is_not_nan())
+            .sort(column, descending=True, maintain_order=True)
+            .head(limit)
+            .with_columns(anomaly_reason=pl.lit(reason))
+        )
+
+    return (
+        pl.concat([largest("revenue", "high_revenue"), largest("discount_percent", "high_discount")])
+        .unique(subset="order_id", keep="first", maintain_order=True)
+        .head(limit)
+        .with_columns(rank=pl.int_range(1, pl.len() + 1, dtype=pl.Int64))
+        .select(
+            "rank",
+            "order_id",
+            "product_name",
+            "category",
+            "region",
+            pl.col("revenue").round(2),
+            pl.col("quantity").cast(pl.Int64),
+            pl.col("unit_price").round(2),
+            pl.col("discount_percent").round(4),
+            "sale_date",
+            "anomaly_reason",
+        )
+    )
+
+
+def build_polars_aggregations(
+    clean_parquet: Path,
+    *,
+    top_products_limit: int = 10,
+    anomaly_limit: int = 5,
+) -> dict[str, pd.DataFrame]:
+    """Compute every aggregation with Polars, collecting all plans in one streaming run."""
+    scan = _scan_clean_data(clean_parquet)
+    plans = {
+        "monthly_sales_summary": _monthly_sales_summary(scan),
+        "top_products_by_category": _top_products_by_category(scan, top_products_limit),
+        "region_wise_performance": _region_wise_performance(scan),
+        "top_categories": _top_categories(scan),
+        "anomaly_records": _anomaly_records(scan, anomaly_limit),
+    }
+    logger.info(f"Collecting {len(plans)} aggregation plans with Polars")
+    frames = pl.collect_all(list(plans.values()), engine="streaming")
+    return {name: frame.to_pandas() for name, frame in zip(plans, frames)}
@@ -1,19 +1,33 @@
 """Utilities for cleaning the raw ecommerce CSV exports."""
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import MutableSet
+from typing import Callable, Iterator
+import csv
 import functools
 import json
 import logging
+import math
 import time
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
 
 from data_pipeline.settings import CLEAN_OUTPUT_DIR, DATA_DIR, REJECTED_OUTPUT_DIR, ensure_directories
 
+try:
+    # Optional C implementation of the fuzzy category match (the ``fuzzy`` extra).
+    from rapidfuzz import process as _fuzzy_process
+    from rapidfuzz.distance import Levenshtein as _FuzzyLevenshtein
+except ImportError:
+    _fuzzy_process = None
+
 
 _CATEGORY_LOOKUP_PATH = DATA_DIR / "lookups" / "common_categories.json"
 with _CATEGORY_LOOKUP_PATH.open(encoding="utf-8") as fh:
@@ -96,6 +110,16 @@ def _resolve_category(value: str) -> str | None:
     if lowered in _CANONICAL_LOOKUP:
         return _CANONICAL_LOOKUP[lowered]
 
+    if _fuzzy_process is not None:
+        match = _fuzzy_process.extractOne(
+            lowered,
+            _CANONICAL_CATEGORIES,
+            scorer=_FuzzyLevenshtein.distance,
+            processor=str.casefold,
+            score_cutoff=_FUZZY_THRESHOLD,
+        )
+        return match[0] if match is not None else None
+
     best_match: str | None = None
     best_distance = _FUZZY_THRESHOLD + 1
     for candidate in _CANONICAL_CATEGORIES:
@@ -135,33 +159,105 @@ class CleanConfig:
     chunk_size: int = 100_000
     drop_zero_quantity: bool = True
     save_rejected_rows: bool = True
+    # Worker processes for the per-chunk checks; 1 cleans in-process.
+    workers: int = 1
+
+
+def _to_string_array(series: pd.Series) -> pa.StringArray:
+    """Return ``series`` as one Arrow string array, nulls kept.
+
+    Chunks arrive as ``string[pyarrow]`` columns, which convert without
+    copying; object columns are converted as usual.
+    """
+    try:
+        strings = pa.array(series, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Non-string values (e.g. numbers in an object column) are stringified first.
+        strings = pa.array(series.astype(str).where(series.notna()), type=pa.string(), from_pandas=True)
+    if isinstance(strings, pa.ChunkedArray):
+        strings = strings.combine_chunks()
+    return strings
+
+
+def _normalise_string_array(series: pd.Series) -> pa.StringArray:
+    """Fill nulls with ``""`` and strip whitespace, as Arrow strings."""
+    return pc.utf8_trim_whitespace(pc.fill_null(_to_string_array(series), ""))
 
 
 def _normalise_string(series: pd.Series) -> pd.Series:
-    return (
-        series.fillna("")
-        .astype(str)
-        .str.strip()
-    )
+    return pd.Series(pd.arrays.ArrowExtensionArray(_normalise_string_array(series)), index=series.index)
+
+
+def _resolve_distinct(series: pd.Series, resolver: Callable[[str], str | None]) -> pd.Series:
+    """Apply ``resolver`` once per distinct value of ``series`` and broadcast the results.
+
+    Raw labels repeat heavily within a chunk, so resolving the uniques from
+    ``pd.factorize`` and indexing by the codes avoids a Python call per row.
+    """
+    codes, uniques = pd.factorize(series)
+    resolved = np.array([resolver(value) for value in uniques], dtype=object)
+    return pd.Series(resolved[codes], index=series.index, dtype="object")
+
+
+_EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+
+def _clean_customer_email_array(series: pd.Series) -> pa.StringArray:
+    # Lower-case and validate in Arrow: the pattern runs on RE2 over the whole
+    # column rather than Python's backtracking re once per row.
+    emails = pc.utf8_lower(_normalise_string_array(series))
+    valid_mask = pc.match_substring_regex(emails, _EMAIL_PATTERN)
+    return pc.if_else(valid_mask, emails, pa.scalar(None, type=pa.string()))
 
 
 def _clean_customer_email(series: pd.Series) -> pd.Series:
-    normalised = _normalise_string(series)
-    emails = normalised.str.lower()
-    valid_mask = emails.str.contains(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", na=False)
-    return emails.where(valid_mask, other=pd.NA)
+    cleaned = _clean_customer_email_array(series)
+    return pd.Series(pd.arrays.ArrowExtensionArray(cleaned), index=series.index)
+
 
+_NUMBER_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
 
-def _clean_numeric(series: pd.Series, dtype: str = "float") -> pd.Series:
-    numeric = pd.to_numeric(series, errors="coerce")
+
+def _parse_float(series: pd.Series) -> pa.Array:
+    """Parse a column to float64 in Arrow, with null wherever the value is not a number.
+
+    Arrow's string cast raises on the first malformed value, so the strings
+    are validated with one regex pass first and only the matches are cast.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return pa.array(series, type=pa.float64(), from_pandas=True)
+    strings = pc.utf8_trim_whitespace(_to_string_array(series))
+    valid_mask = pc.match_substring_regex(strings, _NUMBER_PATTERN)
+    numbers = pc.replace_substring_regex(strings, pattern=r"^\+", replacement="")
+    return pc.cast(pc.if_else(valid_mask, numbers, pa.scalar(None, type=pa.string())), pa.float64())
+
+
+def _clean_numeric(series: pd.Series, dtype: str = "float") -> np.ndarray:
+    numeric = pc.fill_null(_parse_float(series), 0.0)
     if dtype == "int":
-        return numeric.fillna(0).clip(lower=0).round().astype("Int64")
-    return numeric.fillna(0.0)
+        # Clamp just past ``_MAX_QUANTITY`` before the cast so huge values and
+        # infinities are rejected as invalid quantities instead of wrapping.
+        numeric = pc.round(pc.min_element_wise(pc.max_element_wise(numeric, 0.0), float(_MAX_QUANTITY + 1)))
+        return numeric.to_numpy().astype(np.int64)
+    return numeric.to_numpy()
 
 
-def _clean_discount(series: pd.Series) -> pd.Series:
-    numeric = pd.to_numeric(series, errors="coerce").fillna(0.0)
-    return numeric.clip(lower=0.0, upper=1.0)
+def _clean_discount(series: pd.Series) -> np.ndarray:
+    numeric = pc.fill_null(_parse_float(series), 0.0)
+    clipped = pc.min_element_wise(pc.max_element_wise(numeric, 0.0), 1.0)
+    return clipped.to_numpy()
+
+
+def _calculate_revenue(unit_price: np.ndarray, quantity: np.ndarray, discount_percent: np.ndarray) -> np.ndarray:
+    """Return ``unit_price * quantity * (1 - discount_percent)`` rounded to cents.
+
+    Rounds in place, in the same operation order as the pandas expression so
+    the results are bit-for-bit identical.
+    """
+    revenue = np.multiply(unit_price, quantity, dtype=np.float64)
+    np.multiply(revenue, np.subtract(1.0, discount_percent), out=revenue)
+    np.round(revenue, 2, out=revenue)
+    return revenue
 
 
 # Cache for date parsing - key: date_string, value: (format_index, parsed_date)
@@ -233,23 +329,152 @@ def _parse_multiple_date_formats(date_string: str) -> pd.Timestamp | None:
     return None
 
 
-def _clean_chunk(frame: pd.DataFrame, seen_order_ids: MutableSet[str], config: CleanConfig) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _parse_sale_date_array(series: pd.Series) -> pa.TimestampArray:
+    """Parse a date column to an Arrow ``timestamp[s]`` array.
+
+    Each supported format is tried with Arrow's ``strptime`` and the first
+    that parses wins per row, in the same order as the scalar parser; rows
+    matching no format are null.
+    """
+    strings = _normalise_string_array(series)
+    return pc.coalesce(
+        *(pc.strptime(strings, format=fmt, unit="s", error_is_null=True) for fmt in _date_formats)
+    )
+
+
+def _parse_sale_dates(series: pd.Series) -> pd.Series:
+    """Vectorised :func:`_parse_multiple_date_formats` over a whole column; unparseable rows are NaT."""
+    parsed = _parse_sale_date_array(series)
+    return parsed.to_pandas(coerce_temporal_nanoseconds=True).set_axis(series.index)
+
+
+class _OrderIdTracker:
+    """Order ids accepted from earlier chunks, indexed by 64-bit hash.
+
+    The ids are kept in Arrow string arrays next to their sorted hashes, a few
+    bytes per id instead of a Python string. Runs merge like a binary counter,
+    so each id is re-merged O(log n) times and a lookup binary-searches every
+    run. A hash match is confirmed against the stored id, so a collision never
+    rejects a new id.
+    """
+
+    def __init__(self) -> None:
+        self._runs: list[tuple[np.ndarray, pa.LargeStringArray]] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def contains(self, hashes: np.ndarray, ids: pa.StringArray) -> np.ndarray:
+        """Return which of ``ids``, hashed to ``hashes``, are tracked."""
+        found = np.zeros(len(hashes), dtype=bool)
+        for run_hashes, run_ids in self._runs:
+            lower = np.searchsorted(run_hashes, hashes, side="left")
+            upper = np.searchsorted(run_hashes, hashes, side="right")
+            # Compare the id at each matching position; equal hashes of
+            # different ids are rare, so this is almost always one pass.
+            for offset in range(int((upper - lower).max(initial=0))):
+                hits = np.flatnonzero(~found & (lower + offset < upper))
+                stored = run_ids.take(pa.array(lower[hits] + offset))
+                equal = pc.equal(stored, pc.cast(ids.take(pa.array(hits)), pa.large_string()))
+                found[hits] = equal.to_numpy(zero_copy_only=False)
+        return found
+
+    def add(self, hashes: np.ndarray, ids: pa.StringArray) -> None:
+        """Remember ``ids`` with their ``hashes``; none may already be tracked."""
+        order = np.argsort(hashes, kind="stable")
+        run = (hashes[order], pc.cast(ids, pa.large_string()).take(pa.array(order)))
+        self._size += len(order)
+        # Keep run sizes decreasing by merging runs no larger than the new one.
+        while self._runs and len(self._runs[-1][0]) <= len(order):
+            older_hashes, older_ids = self._runs.pop()
+            merged = np.concatenate([older_hashes, run[0]])
+            order = np.argsort(merged, kind="stable")
+            run = (merged[order], pa.concat_arrays([older_ids, run[1]]).take(pa.array(order)))
+        if len(order):
+            self._runs.append(run)
+
+
+# Rejection reasons in the order the checks run; a row is rejected for the
+# first check it fails.
+_REJECTION_REASONS = (
+    "missing_order_id_or_product",
+    "duplicate_order_id",
+    "unknown_category",
+    "unknown_region",
+    "invalid_unit_price",
+    "zero_quantity",
+    "invalid_quantity",
+    "invalid_sale_date",
+    "sale_date_out_of_range",
+    "invalid_calculated_revenue",
+)
+
+
+_DUPLICATE_ORDER_ID = _REJECTION_REASONS.index("duplicate_order_id") + 1
+
+# quantity is written as int32 and discount_percent, which lies in [0, 1], as
+# float32. Prices and revenue stay float64: they are money and get summed.
+_MAX_QUANTITY = np.iinfo(np.int32).max
+
+
+def _sale_date_bounds() -> tuple[int, int]:
+    """Return the accepted sale date range as inclusive Unix seconds.
+
+    The range runs from 20 years ago to 1 year ahead. It is computed once per
+    run so every chunk is checked against the same window.
+    """
+    now = pd.Timestamp.now()
+    min_date = now - pd.DateOffset(years=20)
+    max_date = now + pd.DateOffset(years=1)
+    return math.ceil(min_date.timestamp()), math.floor(max_date.timestamp())
+
+
+@dataclass
+class _LocalCleanResult:
+    """Outcome of the checks that only need the chunk itself."""
+
+    # Cleaned rows that passed every local check, in chunk order.
+    cleaned: pa.Table
+    # Per-row rejection codes; see ``_clean_chunk_local``.
+    reason: np.ndarray
+    # Normalised order ids of every row and their 64-bit hashes, for the
+    # cross-chunk check.
+    order_ids: pa.StringArray
+    order_hashes: np.ndarray
+
+
+def _clean_chunk(frame: pd.DataFrame, seen_order_ids: _OrderIdTracker, config: CleanConfig) -> tuple[pa.Table, pd.DataFrame]:
     """Clean a data chunk and return both cleaned data and rejected rows."""
-    # Make a shallow copy so that we do not mutate the original chunk returned by pandas.
-    data = frame.copy()
-    rejected_rows = []
-    
-    # Add rejection tracking
-    def _reject_rows(mask, reason):
-        if config.save_rejected_rows:
-            rejected = data[~mask].copy()
-            rejected["rejection_reason"] = reason
-            rejected_rows.append(rejected)
-        return data[mask]
+    local = _clean_chunk_local(frame, config, _sale_date_bounds())
+    return _finish_chunk(frame, local, seen_order_ids, config)
+
+
+def _clean_chunk_local(
+    frame: pd.DataFrame,
+    config: CleanConfig,
+    sale_date_bounds: tuple[int, int],
+) -> _LocalCleanResult:
+    """Run every check on a chunk except the cross-chunk duplicate check.
+
+    Each check runs over the whole chunk and records, per row, the first
+    check it fails in ``reason`` (0 keeps the row, otherwise one plus the
+    index into ``_REJECTION_REASONS``). The chunk is sliced once at the end
+    rather than after every step, straight into the Arrow table that gets
+    written. Needs no state from other chunks, so chunks can be cleaned in
+    worker processes.
+    """
+    reason = np.zeros(len(frame), dtype=np.int8)
+
+    def _reject_invalid(valid_mask, rejection_reason: str) -> None:
+        if isinstance(valid_mask, pd.Series):
+            valid_mask = valid_mask.to_numpy(dtype=bool, na_value=False)
+        code = _REJECTION_REASONS.index(rejection_reason) + 1
+        reason[(reason == 0) & ~valid_mask] = code
 
     # Step 1: Normalise order identifiers and drop rows without a valid ID or product.
-    data["order_id"] = _normalise_string(data.get("order_id"))
-    data["product_name"] = _normalise_string(data.get("product_name"))
+    order_id = _normalise_string_array(frame.get("order_id"))
+    product_name = _normalise_string_array(frame.get("product_name"))
     
     # TODO: Improve validation logic - add more sophisticated checks:
     # - Order ID format validation (e.g., must match specific pattern)
@@ -261,158 +486,217 @@ def _clean_chunk(frame: pd.DataFrame, seen_order_ids: MutableSet[str], config: C
     # - Email format validation improvements
     # - Date range validation (e.g., within last 10 years)
     
-    valid_ids_mask = (data["order_id"] != "") & (data["product_name"] != "")
-    data = _reject_rows(valid_ids_mask, "missing_order_id_or_product")
+    present = pc.and_(pc.not_equal(order_id, ""), pc.not_equal(product_name, ""))
+    _reject_invalid(present.to_numpy(zero_copy_only=False), "missing_order_id_or_product")
+
+    # Step 2: Remove duplicates within the chunk among the rows that passed step 1;
+    # duplicates of earlier chunks are rejected by ``_finish_chunk``. Dictionary
+    # codes number the distinct ids exactly, so the first row of each id is the
+    # first occurrence of its code.
+    candidates = np.flatnonzero(reason == 0)
+    codes = pc.dictionary_encode(order_id.take(pa.array(candidates))).indices.to_numpy()
+    _, first_positions = np.unique(codes, return_index=True)
+    duplicated = np.zeros(len(frame), dtype=bool)
+    duplicated[candidates] = True
+    duplicated[candidates[first_positions]] = False
+    _reject_invalid(~duplicated, "duplicate_order_id")
+    order_hashes = pd.util.hash_array(order_id.to_numpy(zero_copy_only=False))
 
-    if data.empty:
-        rejected_frames = [frame for frame in rejected_rows if not frame.empty]
-        rejected_df = pd.concat(rejected_frames, ignore_index=True) if rejected_frames else pd.DataFrame()
-        return data, rejected_df
+    # Step 3: Standardise categorical features.
+    category = _resolve_distinct(_normalise_string(frame.get("category")), _resolve_category)
+    _reject_invalid(category.notna(), "unknown_category")
 
-    # Step 2: Remove duplicates both within the chunk and across chunks seen so far.
-    before_dedup = len(data)
-    
-    # First handle within-chunk duplicates
-    duplicate_within_chunk_mask = ~data.duplicated(subset="order_id", keep="first")
-    data = _reject_rows(duplicate_within_chunk_mask, "duplicate_order_id")
-    
-    # Then handle cross-chunk duplicates using efficient set operations
-    if seen_order_ids:
-        # Use native Python set operations to preserve O(1) lookup
-        chunk_order_ids = set(data["order_id"])
-        duplicate_order_ids = chunk_order_ids & seen_order_ids  # Fast set intersection
-        
-        # Create boolean mask using vectorized operations
-        if duplicate_order_ids:
-            # Only compute mask if there are actual duplicates
-            duplicate_mask = ~data["order_id"].apply(lambda x: x in duplicate_order_ids)
-        else:
-            # No duplicates found, keep all rows
-            duplicate_mask = pd.Series([True] * len(data), index=data.index)
-    else:
-        # No previous order IDs to check against
-        duplicate_mask = pd.Series([True] * len(data), index=data.index)
-    
-    data = _reject_rows(duplicate_mask, "duplicate_order_id")
+    region = _resolve_distinct(_normalise_string(frame.get("region")), _resolve_region)
+    _reject_invalid(region.notna(), "unknown_region")
 
-    # Step 3: Standardise categorical features.
-    raw_categories = _normalise_string(data.get("category"))
-    resolved_categories = [_resolve_category(value) for value in raw_categories.tolist()]
-    resolved_series = pd.Series(resolved_categories, index=data.index, dtype="object")
-    valid_category_mask = resolved_series.notna()
-    data = _reject_rows(valid_category_mask, "unknown_category")
-    if data.empty:
-        rejected_frames = [frame for frame in rejected_rows if not frame.empty]
-        rejected_df = pd.concat(rejected_frames, ignore_index=True) if rejected_frames else pd.DataFrame()
-        return data, rejected_df
-
-    resolved_series = resolved_series.astype("string")
-    data = data.assign(category=resolved_series.loc[data.index])
-
-    raw_regions = _normalise_string(data.get("region"))
-    resolved_regions = [_resolve_region(value) for value in raw_regions.tolist()]
-    region_series = pd.Series(resolved_regions, index=data.index, dtype="object")
-    valid_region_mask = region_series.notna()
-    data = _reject_rows(valid_region_mask, "unknown_region")
-    if data.empty:
-        rejected_frames = [frame for frame in rejected_rows if not frame.empty]
-        rejected_df = pd.concat(rejected_frames, ignore_index=True) if rejected_frames else pd.DataFrame()
-        return data, rejected_df
-
-    region_series = region_series.astype("string")
-    data = data.assign(region=region_series.loc[data.index])
-
-    # Step 4: Clean numeric fields and validate ranges.
-    data["quantity"] = _clean_numeric(data.get("quantity"), dtype="int")
-    data["unit_price"] = _clean_numeric(data.get("unit_price"))
-    data["discount_percent"] = _clean_discount(data.get("discount_percent"))
+    # Step 4: Clean numeric fields and validate ranges. The numeric fields stay
+    # plain numpy arrays through step 7, so each check is a single ufunc pass.
+    quantity = _clean_numeric(frame.get("quantity"), dtype="int")
+    unit_price = _clean_numeric(frame.get("unit_price"))
+    discount_percent = _clean_discount(frame.get("discount_percent"))
 
     # Basic validation: negative prices or extreme values
-    valid_price_mask = (data["unit_price"] > 0) & (data["unit_price"] < 50000)  # $0-$50k range
-    data = _reject_rows(valid_price_mask, "invalid_unit_price")
+    _reject_invalid((unit_price > 0) & (unit_price < 50000), "invalid_unit_price")  # $0-$50k range
 
     # Flag heavy discounts for downstream anomaly review
-    heavy_discount_mask = data["discount_percent"] > 0.80
-    if heavy_discount_mask.any():
-        data.loc[heavy_discount_mask, "anomaly_flag"] = "heavy_discount"
+    heavy_discount = (discount_percent > 0.80) & (reason == 0)
 
     # Step 5: Drop zero quantity if configured
     if config.drop_zero_quantity:
-        zero_qty_mask = data["quantity"] > 0
-        data = _reject_rows(zero_qty_mask, "zero_quantity")
+        _reject_invalid(quantity > 0, "zero_quantity")
+    _reject_invalid(quantity <= _MAX_QUANTITY, "invalid_quantity")
 
     # Step 6: Parse dates, validate, and convert to Unix timestamps.
-    sale_date_strings = _normalise_string(data.get("sale_date"))
-    sale_dates = sale_date_strings.apply(_parse_multiple_date_formats)
-    data["sale_date"] = sale_dates
-
-    # Reject rows with invalid dates
-    valid_date_mask = data["sale_date"].notna()
-    data = _reject_rows(valid_date_mask, "invalid_sale_date")
-
-    # Additional date validation: reasonable date range (last 20 years to 1 year in future)
-    if not data.empty:
-        now = pd.Timestamp.now()
-        min_date = now - pd.DateOffset(years=20)
-        max_date = now + pd.DateOffset(years=1)
-        
-        date_range_mask = (data["sale_date"] >= min_date) & (data["sale_date"] <= max_date)
-        data = _reject_rows(date_range_mask, "sale_date_out_of_range")
-
-    if not data.empty:
-        unix_sale_dates = (data["sale_date"].astype("int64") // 1_000_000_000).astype("Int64")
-        data = data.assign(sale_date=unix_sale_dates)
-
-    if data.empty:
-        rejected_frames = [frame for frame in rejected_rows if not frame.empty]
-        rejected_df = pd.concat(rejected_frames, ignore_index=True) if rejected_frames else pd.DataFrame()
-        return data, rejected_df
-
-    # Step 7: Clean emails and recompute revenue from the cleaned figures.
-    data["customer_email"] = _clean_customer_email(data.get("customer_email"))
-    data["revenue"] = (data["unit_price"] * data["quantity"] * (1 - data["discount_percent"]))
-    data["revenue"] = data["revenue"].round(2)
-    
-    # Validate calculated revenue
-    valid_revenue_mask = (data["revenue"] >= 0) & (data["revenue"] < 1000000)  # $0-$1M per order
-    data = _reject_rows(valid_revenue_mask, "invalid_calculated_revenue")
+    # timestamp[s] is stored as int64 Unix seconds, so the cast only relabels the buffer.
+    sale_date = _parse_sale_date_array(frame.get("sale_date"))
+    _reject_invalid(sale_date.is_valid().to_numpy(zero_copy_only=False), "invalid_sale_date")
+    sale_seconds = pc.fill_null(pc.cast(sale_date, pa.int64()), 0).to_numpy()
+
+    # Additional date validation: reasonable date range (see ``_sale_date_bounds``)
+    min_seconds, max_seconds = sale_date_bounds
+    _reject_invalid((sale_seconds >= min_seconds) & (sale_seconds <= max_seconds), "sale_date_out_of_range")
+
+    # Step 7: Recompute revenue from the cleaned figures and validate it.
+    revenue = _calculate_revenue(unit_price, quantity, discount_percent)
+    _reject_invalid((revenue >= 0) & (revenue < 1000000), "invalid_calculated_revenue")  # $0-$1M per order
+
+    # Slice once: only the surviving rows are cleaned, built directly as the
+    # typed Arrow columns the parquet writer expects.
+    kept = reason == 0
+    kept_mask = pa.array(kept)
+    columns = {
+        "order_id": order_id.filter(kept_mask),
+        "product_name": pc.dictionary_encode(product_name.filter(kept_mask)),
+        "category": pc.dictionary_encode(pa.array(category.to_numpy()[kept], type=pa.string())),
+        "quantity": pa.array(quantity[kept], type=pa.int32()),
+        "unit_price": pa.array(unit_price[kept], type=pa.float64()),
+        "discount_percent": pa.array(discount_percent[kept], type=pa.float32()),
+        "region": pc.dictionary_encode(pa.array(region.to_numpy()[kept], type=pa.string())),
+        "sale_date": pa.array(sale_seconds[kept], type=pa.int64()),
+        "customer_email": _clean_customer_email_array(frame.get("customer_email")[kept]),
+        "revenue": pa.array(revenue[kept], type=pa.float64()),
+        "anomaly_flag": (
+            pa.array(np.where(heavy_discount[kept], "heavy_discount", None), type=pa.string())
+            if heavy_discount.any()
+            else pa.nulls(int(kept.sum()), type=pa.string())
+        ),
+    }
+    cleaned_data = pa.table(columns, schema=_CLEAN_SCHEMA)
+
+    return _LocalCleanResult(cleaned=cleaned_data, reason=reason, order_ids=order_id, order_hashes=order_hashes)
+
+
+def _finish_chunk(
+    frame: pd.DataFrame,
+    local: _LocalCleanResult,
+    seen_order_ids: _OrderIdTracker,
+    config: CleanConfig,
+) -> tuple[pa.Table, pd.DataFrame]:
+    """Reject duplicates of earlier chunks and split the chunk into cleaned and rejected rows.
+
+    Runs serially, in chunk order. A row whose id was accepted in an earlier
+    chunk is a duplicate unless it already failed step 1 or 2, matching the
+    order the checks run in. Rejected rows keep their raw values.
+    """
+    reason = local.reason
+    locally_kept = reason == 0
+    if len(seen_order_ids):
+        seen = seen_order_ids.contains(local.order_hashes, local.order_ids)
+        reason[seen & (locally_kept | (reason > _DUPLICATE_ORDER_ID))] = _DUPLICATE_ORDER_ID
+
+    kept = reason == 0
+    cleaned_data = local.cleaned.filter(pa.array(kept[locally_kept]))
 
     # Update the tracker with order IDs that made it through the filters.
-    seen_order_ids.update(data["order_id"].tolist())
-
-    # Reorder columns for consistency before persisting.
-    columns = [
-        "order_id",
-        "product_name",
-        "category",
-        "quantity",
-        "unit_price",
-        "discount_percent",
-        "region",
-        "sale_date",
-        "customer_email",
-        "revenue",
-    ]
+    seen_order_ids.add(local.order_hashes[kept], local.order_ids.filter(pa.array(kept)))
+
+    rejected_df = pd.DataFrame()
+    if config.save_rejected_rows and not kept.all():
+        rejected_df = frame[~kept].assign(
+            rejection_reason=pd.Categorical.from_codes(reason[~kept] - 1, _REJECTION_REASONS)
+        )
 
-    if "anomaly_flag" in data.columns:
-        columns.append("anomaly_flag")
-    cleaned_data = data[columns]
-    rejected_frames = [frame for frame in rejected_rows if not frame.empty]
-    rejected_df = pd.concat(rejected_frames, ignore_index=True) if rejected_frames else pd.DataFrame()
-    
     return cleaned_data, rejected_df
 
 
-def _to_parquet_table(frame: pd.DataFrame) -> pa.Table:
-    """Normalise dtypes so pyarrow can serialise mixed data reliably."""
-    if frame.empty:
-        return pa.Table.from_pandas(frame, preserve_index=False)
+def _clean_chunks_locally(
+    chunks: Iterator[pd.DataFrame],
+    config: CleanConfig,
+    sale_date_bounds: tuple[int, int],
+) -> Iterator[tuple[pd.DataFrame, _LocalCleanResult]]:
+    """Yield each chunk with its local clean result, in input order.
+
+    With more than one worker the local checks run in a process pool, with a
+    bounded number of chunks in flight, while the caller finishes and writes
+    earlier chunks.
+    """
+    if config.workers <= 1:
+        for chunk in chunks:
+            yield chunk, _clean_chunk_local(chunk, config, sale_date_bounds)
+        return
+
+    with ProcessPoolExecutor(max_workers=config.workers) as executor:
+        in_flight: deque[tuple[pd.DataFrame, Future[_LocalCleanResult]]] = deque()
+        for chunk in chunks:
+            in_flight.append((chunk, executor.submit(_clean_chunk_local, chunk, config, sale_date_bounds)))
+            if len(in_flight) >= 2 * config.workers:
+                chunk, future = in_flight.popleft()
+                yield chunk, future.result()
+        while in_flight:
+            chunk, future = in_flight.popleft()
+            yield chunk, future.result()
+
+
+# Rows per row group of the cleaned parquet output.
+_CLEAN_ROW_GROUP_SIZE = 1_000_000
+
+# Low-cardinality label columns, written dictionary-encoded.
+_DICTIONARY_COLUMNS = ("product_name", "category", "region")
+
+# Schema of the cleaned parquet output; every chunk is built to it.
+_DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+_CLEAN_SCHEMA = pa.schema(
+    [
+        ("order_id", pa.string()),
+        ("product_name", _DICTIONARY_TYPE),
+        ("category", _DICTIONARY_TYPE),
+        ("quantity", pa.int32()),
+        ("unit_price", pa.float64()),
+        ("discount_percent", pa.float32()),
+        ("region", _DICTIONARY_TYPE),
+        ("sale_date", pa.int64()),
+        ("customer_email", pa.string()),
+        ("revenue", pa.float64()),
+        ("anomaly_flag", pa.string()),
+    ]
+)
+
 
-    converted = frame.convert_dtypes()
-    for column in converted.columns:
-        if str(converted[column].dtype) == "object":
-            converted[column] = converted[column].astype("string")
-    return pa.Table.from_pandas(converted, preserve_index=False)
+def _iter_csv_chunks(input_csv: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Stream the raw CSV as pandas frames of ``string[pyarrow]`` columns, ``chunk_size`` rows each.
+
+    Arrow's streaming reader tokenises blocks on its own threads. Every column
+    is read as a string, so malformed numbers and dates reach the cleaning
+    steps, which coerce or reject them, instead of failing the parse. Only
+    empty fields are null, as with ``keep_default_na=False, na_values=[""]``.
+    """
+    with input_csv.open(newline="", encoding="utf-8") as fh:
+        header = next(csv.reader(fh), [])
+    reader = pa_csv.open_csv(
+        input_csv,
+        read_options=pa_csv.ReadOptions(block_size=max(chunk_size * 256, 1 << 20)),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            null_values=[""],
+            strings_can_be_null=True,
+        ),
+    )
+
+    # Re-slice the reader's byte-sized blocks into chunks of chunk_size rows.
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in reader:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunk_size:
+            table = pa.Table.from_batches(pending)
+            yield table.slice(0, chunk_size).to_pandas(types_mapper=pd.ArrowDtype)
+            remainder = table.slice(chunk_size)
+            pending = remainder.to_batches()
+            pending_rows = remainder.num_rows
+    if pending_rows:
+        yield pa.Table.from_batches(pending).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def _to_rejected_table(frame: pd.DataFrame) -> pa.Table:
+    """Convert rejected rows to an all-string table.
+
+    Rejected rows keep their raw CSV values, so every column is written as a
+    string; a column that is null throughout a chunk would otherwise be typed
+    ``null`` and break the writer's schema.
+    """
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    return table.cast(pa.schema([(name, pa.string()) for name in table.column_names]))
 
 
 def clean_csv_to_parquet(
@@ -454,9 +738,24 @@ def clean_csv_to_parquet(
         rejected_csv = REJECTED_OUTPUT_DIR / f"{input_csv.stem}_rejected.csv"
         rejected_csv.parent.mkdir(parents=True, exist_ok=True)
 
-    seen_order_ids: set[str] = set()
-    writer: pq.ParquetWriter | None = None
-    rejected_csv_written = False
+    seen_order_ids = _OrderIdTracker()
+    writer = pq.ParquetWriter(
+        output_parquet,
+        _CLEAN_SCHEMA,
+        compression="zstd",
+        use_dictionary=list(_DICTIONARY_COLUMNS),
+        write_statistics=True,
+        data_page_size=1 << 20,
+    )
+    # Cleaned chunks are buffered and written as full row groups rather than
+    # one small row group per CSV chunk.
+    pending_tables: list[pa.Table] = []
+    pending_rows = 0
+    # Full row groups are compressed and written on a background thread while
+    # the next chunks are cleaned; the writer releases the GIL while it works.
+    io_pool = ThreadPoolExecutor(max_workers=1)
+    pending_write: Future[None] | None = None
+    rejected_writer: pa_csv.CSVWriter | None = None
     
     # Progress tracking
     total_input_rows = 0
@@ -467,46 +766,57 @@ def clean_csv_to_parquet(
     
     logger.info(f"Starting to process CSV file: {input_csv}")
     logger.info(f"Chunk size: {cfg.chunk_size:,} rows")
+    logger.info(f"Cleaning workers: {cfg.workers}")
+    logger.info(f"Writing {len(_CLEAN_SCHEMA)} columns to: {output_parquet}")
     logger.info(f"Save rejected rows: {cfg.save_rejected_rows}")
     if rejected_csv:
         logger.info(f"Rejected rows will be saved to: {rejected_csv}")
 
     try:
-        csv_reader = pd.read_csv(input_csv, chunksize=cfg.chunk_size, keep_default_na=False, na_values=[""])
-        
-        for chunk_num, chunk in enumerate(csv_reader, 1):
+        local_results = _clean_chunks_locally(
+            _iter_csv_chunks(input_csv, cfg.chunk_size), cfg, _sale_date_bounds()
+        )
+        for chunk_num, (chunk, local) in enumerate(local_results, 1):
             chunk_start = time.time()
             input_rows = len(chunk)
             total_input_rows += input_rows
             
             logger.debug(f"Processing chunk {chunk_num} ({input_rows:,} rows)")
             
-            cleaned, rejected = _clean_chunk(chunk, seen_order_ids, cfg)
-            output_rows = len(cleaned) if not cleaned.empty else 0
+            # Duplicates of earlier chunks are resolved here, serially and in order.
+            cleaned, rejected = _finish_chunk(chunk, local, seen_order_ids, cfg)
+            output_rows = cleaned.num_rows
             rejected_rows = len(rejected) if not rejected.empty else 0
             total_output_rows += output_rows
             total_rejected_rows += rejected_rows
             
             # Write clean data
-            if not cleaned.empty:
-                cleaned_table = _to_parquet_table(cleaned)
-                if writer is None:
-                    writer = pq.ParquetWriter(output_parquet, cleaned_table.schema, compression="snappy")
-                    logger.info(f"Created parquet writer with schema: {len(cleaned_table.schema)} columns")
-
-                writer.write_table(cleaned_table)
+            if cleaned.num_rows:
+                pending_tables.append(cleaned)
+                pending_rows += cleaned.num_rows
+                if pending_rows >= _CLEAN_ROW_GROUP_SIZE:
+                    buffered = pa.concat_tables(pending_tables)
+                    full_rows = pending_rows - pending_rows % _CLEAN_ROW_GROUP_SIZE
+                    if pending_write is not None:
+                        pending_write.result()
+                    pending_write = io_pool.submit(
+                        writer.write_table, buffered.slice(0, full_rows), row_group_size=_CLEAN_ROW_GROUP_SIZE
+                    )
+                    pending_tables = [buffered.slice(full_rows)]
+                    pending_rows -= full_rows
                 chunks_processed += 1
 
-            # Write rejected data to CSV
+            # Stream rejected data to CSV through one writer kept open for the run
             if not rejected.empty and cfg.save_rejected_rows:
-                if not rejected_csv_written:
-                    # Write header on first write
-                    rejected.to_csv(rejected_csv, index=False, mode='w')
-                    rejected_csv_written = True
-                    logger.info(f"Created rejected rows CSV with {len(rejected.columns)} columns")
-                else:
-                    # Append without header
-                    rejected.to_csv(rejected_csv, index=False, mode='a', header=False)
+                rejected_table = _to_rejected_table(rejected)
+                if rejected_writer is None:
+                    rejected_writer = pa_csv.CSVWriter(
+                        rejected_csv,
+                        rejected_table.schema,
+                        write_options=pa_csv.WriteOptions(quoting_style="needed"),
+                    )
+                    logger.info(f"Created rejected rows CSV with {rejected_table.num_columns} columns")
+                rejected_writer.write_table(rejected_table)
             
             chunk_elapsed = time.time() - chunk_start
             retention_rate = (output_rows / input_rows) * 100 if input_rows > 0 else 0
@@ -521,36 +831,27 @@ def clean_csv_to_parquet(
                 logger.info(f"Total progress: {total_input_rows:,} rows processed, "
                            f"{total_output_rows:,} clean, {total_rejected_rows:,} rejected ({rate:.0f} rows/sec)")
                 logger.info(f"Unique order IDs seen: {len(seen_order_ids):,}")
+
+        if pending_write is not None:
+            pending_write.result()
+        if pending_rows:
+            writer.write_table(pa.concat_tables(pending_tables), row_group_size=_CLEAN_ROW_GROUP_SIZE)
                 
     except Exception as e:
         logger.error(f"Error during CSV processing: {e}")
         raise
     finally:
-        if writer is not None:
-            writer.close()
-        # No need to close anything for CSV writing
+        io_pool.shutdown(wait=True)
+        writer.close()
+        if rejected_writer is not None:
+            rejected_writer.close()
 
     elapsed = time.time() - start_time
     
-    if writer is None:
-        logger.warning("No data survived the cleaning process - creating empty parquet file")
-        # No data survived the cleaning stage. Emit an empty parquet file so the
-        # downstream stages still have a predictable artefact to read.
-        empty_df = pd.DataFrame(
-            columns=[
-                "order_id",
-                "product_name",
-                "category",
-                "quantity",
-                "unit_price",
-                "discount_percent",
-                "region",
-                "sale_date",
-                "customer_email",
-                "revenue",
-            ]
-        )
-        pq.write_table(pa.Table.from_pandas(empty_df, preserve_index=False), output_parquet)
+    if total_output_rows == 0:
+        # The writer was opened with the full schema up front, so downstream
+        # stages still get a predictable, empty artefact to read.
+        logger.warning("No data survived the cleaning process - wrote an empty parquet file")
     else:
         overall_retention = (total_output_rows / total_input_rows) * 100 if total_input_rows > 0 else 0
         overall_rejection = (total_rejected_rows / total_input_rows) * 100 if total_input_rows > 0 else 0
@@ -36,6 +36,12 @@ def parse_args() -> argparse.Namespace:
         default=5,
         help="Number of anomaly records to identify (default: 5).",
     )
+    parser.add_argument(
+        "--engine",
+        choices=["pandas", "polars"],
+        default="pandas",
+        help="Aggregation engine; polars requires the optional polars extra (default: pandas).",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -67,6 +73,7 @@ def main() -> None:
     logger.info(f"Output directory: {args.output}")
     logger.info(f"Top products by category limit: {args.top_products_by_category}")
     logger.info(f"Anomaly records limit: {args.anomaly_limit}")
+    logger.info(f"Engine: {args.engine}")
     
     # Get input file size
     file_size_mb = args.cleaned.stat().st_size / (1024 * 1024)
@@ -80,7 +87,8 @@ def main() -> None:
             args.cleaned, 
             args.output, 
             top_products_limit=args.top_products_by_category,
-            anomaly_limit=args.anomaly_limit
+            anomaly_limit=args.anomaly_limit,
+            engine=args.engine,
         )
         elapsed = time.time() - start_time
         
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import time
 from pathlib import Path
 
@@ -30,6 +31,12 @@ def parse_args() -> argparse.Namespace:
         default=100_000,
         help="Number of rows to process per chunk when cleaning large files.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes used to clean chunks in parallel (default: number of CPUs).",
+    )
     parser.add_argument(
         "--keep-zero-quantity",
         action="store_true",
@@ -74,6 +81,7 @@ def main() -> None:
 
     logger.info(f"Output file: {output_file}")
     logger.info(f"Chunk size: {args.chunk_size:,} rows")
+    logger.info(f"Workers: {args.workers}")
     logger.info(f"Drop zero quantity: {not args.keep_zero_quantity}")
     logger.info(f"Save rejected rows: {not args.no_save_rejected}")
     
@@ -85,7 +93,8 @@ def main() -> None:
     config = CleanConfig(
         chunk_size=args.chunk_size, 
         drop_zero_quantity=not args.keep_zero_quantity,
-        save_rejected_rows=not args.no_save_rejected
+        save_rejected_rows=not args.no_save_rejected,
+        workers=args.workers,
     )
 
     start_time = time.time()
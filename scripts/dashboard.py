@@ -17,7 +17,9 @@ def main(argv: list[str] | None = None) -> None:
     args = parser.parse_args(argv)
 
     app = create_app()
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    # Serve each request on its own thread so a slow callback does not block
+    # the others; the dashboard's load caches are shared across threads.
+    app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual entry point
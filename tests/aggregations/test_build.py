@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow.parquet as pq
+import pytest
 
 from data_pipeline.aggregations import build_all_aggregations
 
@@ -12,6 +14,10 @@ EXPECTED_FILES = {
 }
 
 
+def _column_types(artefact):
+    return {field.name: field.type for field in pq.read_schema(artefact)}
+
+
 def test_build_all_aggregations_produces_expected_outputs(tmp_path):
     unix_time = int(pd.Timestamp("2023-01-15").timestamp())
     
@@ -38,6 +44,9 @@ def test_build_all_aggregations_produces_expected_outputs(tmp_path):
     results = build_all_aggregations(cleaned_path, output_dir=output_dir, top_products_limit=5, anomaly_limit=2)
 
     assert EXPECTED_FILES == set(results.keys())
+    for artefact in results.values():
+        metadata = pq.ParquetFile(artefact).metadata
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
 
     monthly_summary = pd.read_parquet(results["monthly_sales_summary"])
     assert list(monthly_summary["month"]) == ["2023-01"]
@@ -50,3 +59,103 @@ def test_build_all_aggregations_produces_expected_outputs(tmp_path):
     anomalies = pd.read_parquet(results["anomaly_records"])
     assert len(anomalies) >= 1  # Should have at least 1 anomaly
     assert pd.Timestamp("2023-01-15") == anomalies.loc[0, "sale_date"]
+
+
+# Sort keys that put each aggregation in a deterministic row order.
+_SORT_KEYS = {
+    "monthly_sales_summary": ["month"],
+    "top_products_by_category": ["category", "metric_type", "rank"],
+    "region_wise_performance": ["region"],
+    "top_categories": ["category"],
+    "anomaly_records": ["rank"],
+}
+
+
+def _write_varied_clean_data(path, num_rows=100000):
+    """Write cleaned rows spread over months, products, categories and regions.
+
+    Every order id covers two rows, some category and region labels are null,
+    and revenues and discounts are distinct so rankings have no ties.
+    """
+    month_starts = [pd.Timestamp(f"2023-{month:02d}-15") for month in (1, 2, 3)]
+    categories = ["Electronics", "Home", "Toys", None]
+    regions = ["Mumbai", "Delhi", "Pune", "Goa", None]
+    rows = range(num_rows)
+    pd.DataFrame(
+        {
+            "order_id": [f"ORD-{i // 2}" for i in rows],
+            "product_name": [f"Product-{i % 7}" for i in rows],
+            "category": [categories[i % 4] for i in rows],
+            "quantity": [1 + i % 7 + i % 3 for i in rows],
+            "unit_price": [10.0 + (i % 7) * 3.5 for i in rows],
+            "discount_percent": [(i * 7919 % num_rows) / num_rows for i in rows],
+            "region": [regions[i % 5] for i in rows],
+            "sale_date": [int(month_starts[i // 6 % 3].timestamp()) for i in rows],
+            "customer_email": [f"customer{i}@example.com" for i in rows],
+            "revenue": [100.0 + i * 0.01 for i in rows],
+        }
+    ).to_parquet(path, index=False)
+
+
+def _assert_aggregations_match(actual, expected):
+    assert set(actual) == set(expected) == set(_SORT_KEYS)
+    for name, sort_key in _SORT_KEYS.items():
+        assert _column_types(actual[name]) == _column_types(expected[name])
+        expected_frame = pd.read_parquet(expected[name]).sort_values(sort_key).reset_index(drop=True)
+        actual_frame = pd.read_parquet(actual[name]).sort_values(sort_key).reset_index(drop=True)
+        pd.testing.assert_frame_equal(actual_frame, expected_frame, check_dtype=False)
+
+
+def test_chunked_aggregations_match_in_memory(tmp_path):
+    cleaned_path = tmp_path / "cleaned.parquet"
+    _write_varied_clean_data(cleaned_path)
+
+    in_memory = build_all_aggregations(cleaned_path, output_dir=tmp_path / "in_memory")
+    chunked = build_all_aggregations(cleaned_path, output_dir=tmp_path / "chunked", force_chunked=True)
+
+    _assert_aggregations_match(chunked, in_memory)
+    assert pd.read_parquet(in_memory["monthly_sales_summary"])["order_count"].sum() == 50000
+    assert pd.read_parquet(in_memory["region_wise_performance"])["region"].notna().all()
+    assert pd.read_parquet(in_memory["top_categories"])["category"].notna().all()
+
+
+def test_polars_engine_matches_in_memory(tmp_path):
+    pytest.importorskip("polars")
+    cleaned_path = tmp_path / "cleaned.parquet"
+    _write_varied_clean_data(cleaned_path)
+
+    in_memory = build_all_aggregations(cleaned_path, output_dir=tmp_path / "in_memory")
+    with_polars = build_all_aggregations(cleaned_path, output_dir=tmp_path / "polars", engine="polars")
+
+    _assert_aggregations_match(with_polars, in_memory)
+
+
+def test_unknown_engine_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="engine"):
+        build_all_aggregations(tmp_path / "cleaned.parquet", output_dir=tmp_path, engine="spark")
+
+
+def test_empty_input_writes_empty_aggregations(tmp_path):
+    cleaned_frame = pd.DataFrame(
+        {
+            "order_id": pd.Series([], dtype="object"),
+            "product_name": pd.Series([], dtype="object"),
+            "category": pd.Series([], dtype="object"),
+            "quantity": pd.Series([], dtype="int64"),
+            "unit_price": pd.Series([], dtype="float64"),
+            "discount_percent": pd.Series([], dtype="float64"),
+            "region": pd.Series([], dtype="object"),
+            "sale_date": pd.Series([], dtype="int64"),
+            "customer_email": pd.Series([], dtype="object"),
+            "revenue": pd.Series([], dtype="float64"),
+        }
+    )
+    cleaned_path = tmp_path / "cleaned.parquet"
+    cleaned_frame.to_parquet(cleaned_path, index=False)
+
+    results = build_all_aggregations(cleaned_path, output_dir=tmp_path / "aggregations")
+
+    assert EXPECTED_FILES == set(results.keys())
+    monthly_summary = pd.read_parquet(results["monthly_sales_summary"])
+    assert monthly_summary.empty
+    assert "total_revenue" in monthly_summary.columns
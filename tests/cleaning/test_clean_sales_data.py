@@ -239,3 +239,13 @@ def test_region_acronym_lookup(tmp_path, monkeypatch):
 
     cleaned = pd.read_parquet(output_path)
     assert cleaned.loc[0, "region"] == "Thailand"
+
+
+def test_clean_numeric_int_keeps_huge_quantities_out_of_range():
+    quantity = clean_sales_data._clean_numeric(pd.Series(["3", "1e30", "-5"]), dtype="int")
+    infinite = clean_sales_data._clean_numeric(pd.Series([float("inf")]), dtype="int")
+
+    assert quantity[0] == 3
+    assert quantity[1] > clean_sales_data._MAX_QUANTITY
+    assert quantity[2] == 0
+    assert infinite[0] > clean_sales_data._MAX_QUANTITY
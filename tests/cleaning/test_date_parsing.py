@@ -2,7 +2,7 @@
 
 import pandas as pd
 import pytest
-from data_pipeline.cleaning.clean_sales_data import _parse_multiple_date_formats
+from data_pipeline.cleaning.clean_sales_data import _parse_multiple_date_formats, _parse_sale_dates
 
 
 class TestDateParsing:
@@ -104,4 +104,29 @@ class TestDateParsing:
             if expected is None:
                 assert result is None, f"Expected None for {date_str}, got {result}"
             else:
-                assert result == expected, f"Failed to parse {date_str} correctly"
\ No newline at end of file
+                assert result == expected, f"Failed to parse {date_str} correctly"
+    def test_vectorised_parse_matches_scalar_parse(self):
+        """Test that the column parser agrees with the per-value parser."""
+        values = [
+            "2023-12-25",
+            "12/25/2023",
+            "25-12-2023",
+            "2023/12/25",
+            "13/25/2023",
+            "2023-13-25",
+            "12-31-1999",
+            "invalid",
+            "",
+            None,
+        ]
+        series = pd.Series(values, index=range(10, 20))
+
+        parsed = _parse_sale_dates(series)
+
+        assert list(parsed.index) == list(series.index)
+        for value, result in zip(values, parsed):
+            expected = _parse_multiple_date_formats(value)
+            if expected is None:
+                assert pd.isna(result), f"Expected NaT for {value}, got {result}"
+            else:
+                assert result == expected, f"Failed to parse {value} correctly"
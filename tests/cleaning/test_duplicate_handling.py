@@ -5,11 +5,18 @@ import pytest
 import pandas as pd
 from pathlib import Path
 from data_pipeline.cleaning import clean_csv_to_parquet, CleanConfig
+from data_pipeline.cleaning import clean_sales_data
 
 
 class TestDuplicateHandling:
     """Test that duplicate order IDs are handled correctly."""
     
+    @pytest.fixture(autouse=True)
+    def _outputs_in_tmp_path(self, tmp_path, monkeypatch):
+        """Write the default clean and rejected outputs under ``tmp_path``, not the repo."""
+        monkeypatch.setattr(clean_sales_data, "CLEAN_OUTPUT_DIR", tmp_path / "clean")
+        monkeypatch.setattr(clean_sales_data, "REJECTED_OUTPUT_DIR", tmp_path / "rejected")
+    
     def test_duplicate_order_ids_within_chunk(self, tmp_path):
         """Test duplicate handling when duplicates appear in the same chunk."""
         
@@ -112,6 +119,37 @@ class TestDuplicateHandling:
         assert rejected_df.iloc[0]["product_name"] == "DuplicateWidget"
         assert rejected_df.iloc[0]["region"] == "Singapore"
     
+    def test_duplicate_order_ids_across_chunks_with_workers(self, tmp_path):
+        """Test that cross-chunk duplicates are still caught when chunks are cleaned in parallel."""
+        
+        raw_frame = pd.DataFrame({
+            "order_id": ["ORD-200", "ORD-201", "ORD-200", "ORD-202", "ORD-201", "ORD-203"],
+            "product_name": ["Widget1", "Widget2", "Dup1", "Widget3", "Dup2", "Widget4"],
+            "category": ["Electronics"] * 6,
+            "quantity": [1] * 6,
+            "unit_price": [10.0] * 6,
+            "discount_percent": [0.0] * 6,
+            "region": ["Mumbai"] * 6,
+            "sale_date": ["2023-01-01"] * 6,
+            "customer_email": [f"user{i}@example.com" for i in range(6)],
+        })
+        
+        csv_path = tmp_path / "test_parallel_duplicates.csv"
+        raw_frame.to_csv(csv_path, index=False)
+        
+        clean_path, rejected_path = clean_csv_to_parquet(
+            csv_path,
+            config=CleanConfig(chunk_size=2, save_rejected_rows=True, workers=2)
+        )
+        
+        clean_df = pd.read_parquet(clean_path)
+        assert list(clean_df["order_id"]) == ["ORD-200", "ORD-201", "ORD-202", "ORD-203"]
+        assert list(clean_df["product_name"]) == ["Widget1", "Widget2", "Widget3", "Widget4"]
+        
+        rejected_df = pd.read_csv(rejected_path, keep_default_na=False, na_values=[""])
+        assert list(rejected_df["product_name"]) == ["Dup1", "Dup2"]
+        assert set(rejected_df["rejection_reason"]) == {"duplicate_order_id"}
+    
     def test_na_region_with_duplicates(self, tmp_path):
         """Test that NA regions work correctly even with duplicate order IDs."""
         
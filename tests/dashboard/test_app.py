@@ -0,0 +1,26 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data_dashboard.app import _parquet_unique_values
+
+
+def test_parquet_unique_values_reads_distinct_labels(tmp_path):
+    table = pa.table(
+        {
+            "category": ["Home", "Electronics", None, "Home"],
+            "rank": [1, 1, 2, 2],
+        }
+    )
+    path = tmp_path / "top_products_by_category.parquet"
+    pq.write_table(table, path)
+
+    assert _parquet_unique_values(path, "category") == ["Electronics", "Home"]
+    assert _parquet_unique_values(path, "region") == []
+
+
+def test_parquet_unique_values_reads_dictionary_columns(tmp_path):
+    labels = pa.array(["Pune", "Goa", "Pune"]).dictionary_encode()
+    path = tmp_path / "region_wise_performance.parquet"
+    pq.write_table(pa.table({"region": labels}), path)
+
+    assert _parquet_unique_values(path, "region") == ["Goa", "Pune"]